@@ -1,4 +1,6 @@
 import os
+from collections import deque
+from types import MappingProxyType
 from typing import Any, Dict
 
 # Ensure required env vars exist before importing app modules.
@@ -6,58 +8,100 @@ os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
 os.environ.setdefault("OPENAI_API_KEY", "test-key")
 
 
+class _Immediate:
+    """Awaitable that resolves to a value without creating a coroutine."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        raise StopIteration(self.value)
+
+
+class _InsertResult:
+    __slots__ = ("inserted_id",)
+
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
 class FakeCollection:
+    # Recorded calls kept per collection; older entries are dropped
+    RECORD_LIMIT = 128
+    # When False only the document/filter/update are recorded, not args/kwargs
+    record_full = False
+
     def __init__(self) -> None:
-        self.inserted = []
-        self.updated = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear recorded calls and seeded results between tests."""
+        self.inserted = deque(maxlen=self.RECORD_LIMIT)
+        self.updated = deque(maxlen=self.RECORD_LIMIT)
         self.find_one_result = None
         self.find_one_results = []
         self.find_results = []
         self.last_update_data = None  # Store last update data for assertions
 
-    async def insert_one(self, document: Dict[str, Any], *args, **kwargs):
-        class _InsertResult:
-            def __init__(self, inserted_id):
-                self.inserted_id = inserted_id
-
-        self.inserted.append({"document": document, "args": args, "kwargs": kwargs})
+    def insert_one(self, document: Dict[str, Any], *args, **kwargs):
+        if self.record_full:
+            self.inserted.append({"document": document, "args": args, "kwargs": kwargs})
+        else:
+            self.inserted.append({"document": document})
         inserted_id = document.get("_id", "fake_id")
-        return _InsertResult(inserted_id)
+        return _Immediate(_InsertResult(inserted_id))
 
-    async def update_one(self, filter_dict, update_dict, *args, **kwargs):
-        self.updated.append({"filter": filter_dict, "update": update_dict, "args": args, "kwargs": kwargs})
+    def update_one(self, filter_dict, update_dict, *args, **kwargs):
+        if self.record_full:
+            self.updated.append({"filter": filter_dict, "update": update_dict, "args": args, "kwargs": kwargs})
+        else:
+            self.updated.append({"filter": filter_dict, "update": update_dict})
         self.last_update_data = update_dict  # Store for test assertions
-        return {"matched_count": 1, "modified_count": 1}
+        return _Immediate({"matched_count": 1, "modified_count": 1})
 
-    async def find_one(self, *args, **kwargs):
+    def find_one(self, *args, **kwargs):
         if self.find_one_results:
-            return self.find_one_results.pop(0)
-        return self.find_one_result
+            return _Immediate(self.find_one_results.pop(0))
+        return _Immediate(self.find_one_result)
 
     def find(self, *args, **kwargs):
-        return FakeCursor(list(self.find_results))
+        return FakeCursor(self.find_results)
 
 
 class FakeCursor:
     def __init__(self, items):
-        self.items = list(items)
+        self.items = items
+        self._limit = None
 
     def sort(self, *args, **kwargs):
         return self
 
     def limit(self, limit_count: int):
-        self.items = self.items[:limit_count]
+        self._limit = limit_count
         return self
 
     def __aiter__(self):
         self._iter = iter(self.items)
+        self._emitted = 0
         return self
 
     async def __anext__(self):
+        if self._limit is not None and self._emitted >= self._limit:
+            raise StopAsyncIteration
         try:
-            return next(self._iter)
+            item = next(self._iter)
         except StopIteration:
             raise StopAsyncIteration
+        self._emitted += 1
+        return item
 
 
 class FakeOpenAIClient:
@@ -88,10 +132,10 @@ from src.database import (
     COLLECTION_API_KEYS,
 )
 
-
-@pytest.fixture
-def fake_db(monkeypatch):
-    collections = {
+@pytest.fixture(scope="session")
+def _fake_collections():
+    """In-memory collections built once and reused by every fake_db test."""
+    return {
         COLLECTION_TICKETS: FakeCollection(),
         COLLECTION_AGENT_STATES: FakeCollection(),
         COLLECTION_INTERACTIONS: FakeCollection(),
@@ -101,19 +145,37 @@ def fake_db(monkeypatch):
         COLLECTION_API_KEYS: FakeCollection(),
     }
 
-    def _get_collection(name: str) -> FakeCollection:
-        return collections[name]
 
+@pytest.fixture
+def fake_db(_fake_collections, monkeypatch):
+    """
+    Clean in-memory collections with get_collection patched for this test only.
+
+    The collection objects are shared across the session and reset here;
+    the patch is undone when the test ends, so tests that don't request
+    fake_db always see the real get_collection.
+    """
+    for collection in _fake_collections.values():
+        collection.reset()
+
+    # Read-only view bound as a default argument: no closure lookup per call
+    # and no accidental mutation of the collection set from application code.
+    def _get_collection(name: str, _collections=MappingProxyType(_fake_collections)) -> FakeCollection:
+        return _collections[name]
+
+    # Covers modules that call database.get_collection(...) at call time
+    # (agents, ticket routes, ingest routes, ticket operations). Modules that
+    # import get_collection by name (middleware.auth, company/api-key/human
+    # routes, the Telegram bot, ticket_lifecycle) must be patched where used.
     monkeypatch.setattr("src.database.get_collection", _get_collection)
-    monkeypatch.setattr("src.agents.triage_agent.get_collection", _get_collection)
-    monkeypatch.setattr("src.agents.router_agent.get_collection", _get_collection)
-    monkeypatch.setattr("src.agents.resolver_agent.get_collection", _get_collection)
-    monkeypatch.setattr("src.agents.escalator_agent.get_collection", _get_collection)
-    monkeypatch.setattr("src.api.routes.get_collection", _get_collection)
-    monkeypatch.setattr("src.api.ingest_routes.get_collection", _get_collection)
-    monkeypatch.setattr("src.database.ticket_operations.get_collection", _get_collection)
-
-    return collections
+    return _fake_collections
+
+
+@pytest.fixture
+def full_recording_fake_db(fake_db, monkeypatch):
+    """fake_db variant that also records args/kwargs of every insert/update."""
+    monkeypatch.setattr(FakeCollection, "record_full", True)
+    return fake_db
 
 
 @pytest.fixture
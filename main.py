@@ -1,8 +1,11 @@
 """
 Main FastAPI application for MultiAgent Customer Support System
 """
+import importlib
 import logging
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -10,10 +13,6 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from src.config import settings
 from src.database import ensure_indexes, close_connection
-from src.api import router, ingest_router, telegram_router, company_router, human_router
-from src.api.api_key_routes import router as api_key_router
-from src.api.health_routes import router as health_router
-from src.utils.monitoring import init_sentry, flush_events
 from src.utils.secure_logging import configure_secure_logging
 from src.middleware.rate_limiter import get_rate_limit_key
 from src.middleware.cors import get_cors_origins
@@ -27,39 +26,57 @@ configure_secure_logging(
     include_trace_id=True,
 )
 
+logger = logging.getLogger(__name__)
+
 # Initialize rate limiter with fingerprint-based key (IP + User-Agent + API Key)
 limiter = Limiter(key_func=get_rate_limit_key, default_limits=["100/minute"])
 
+# Routers as (settings flag, module path), in registration order. Core routers
+# have no flag; optional ones are only imported when their flag is enabled, so
+# disabled features don't pay for their dependencies.
+ROUTERS = (
+    (None, "src.api.health_routes"),  # Health checks (no auth required)
+    (None, "src.api.routes"),
+    ("enable_ingest_api", "src.api.ingest_routes"),
+    ("enable_telegram_api", "src.api.telegram_routes"),
+    ("enable_company_api", "src.api.company_routes"),
+    ("enable_human_api", "src.api.human_routes"),
+    ("enable_api_key_api", "src.api.api_key_routes"),
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # Startup
-    print("Starting MultiAgent Customer Support System...")
+    logger.info("Starting MultiAgent Customer Support System...")
+
+    # Sentry SDK is imported here so it isn't loaded at module import time
+    from src.utils.monitoring import init_sentry, flush_events
 
     # Initialize Sentry for error tracking and performance monitoring
     init_sentry()
 
     # Setup database indexes
     await ensure_indexes()
-    print("Database indexes created/verified")
+    logger.info("Database indexes created/verified")
 
     yield
 
     # Shutdown
-    print("Shutting down...")
+    logger.info("Shutting down...")
     
     # Cleanup HTTP clients
     from src.utils.http_client import cleanup_http_clients
     await cleanup_http_clients()
-    print("HTTP clients closed")
+    logger.info("HTTP clients closed")
 
     # Flush pending Sentry events
     flush_events(timeout=2.0)
 
     # Close database connection
     await close_connection()
-    print("Database connection closed")
+    logger.info("Database connection closed")
 
 
 # Create FastAPI app
@@ -67,7 +84,8 @@ app = FastAPI(
     title="MultiAgent Customer Support System",
     description="AI-powered customer support with multiple specialized agents",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter to app state
@@ -107,33 +125,33 @@ app.add_middleware(
 app.add_exception_handler(Exception, secure_exception_handler)
 
 # Include routes
-app.include_router(health_router)  # Health checks (no auth required)
-app.include_router(router)
-app.include_router(ingest_router)
-app.include_router(telegram_router)
-app.include_router(company_router)
-app.include_router(human_router)
-app.include_router(api_key_router)
+for flag, module_path in ROUTERS:
+    if flag is None or getattr(settings, flag):
+        app.include_router(importlib.import_module(module_path).router)
+
+
+# Root payload is constant, so it is serialized once at import
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "name": "MultiAgent Customer Support System",
+    "version": "0.1.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/api/health",
+        "create_ticket": "POST /api/tickets",
+        "run_pipeline": "POST /api/run_pipeline/{ticket_id}",
+        "get_ticket": "GET /api/tickets/{ticket_id}",
+        "get_audit": "GET /api/tickets/{ticket_id}/audit",
+        "list_tickets": "GET /api/tickets",
+        "ingest_message": "POST /api/ingest-message",
+        "telegram_webhook": "POST /telegram/webhook"
+    }
+})
 
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "name": "MultiAgent Customer Support System",
-        "version": "0.1.0",
-        "status": "running",
-        "endpoints": {
-            "health": "/api/health",
-            "create_ticket": "POST /api/tickets",
-            "run_pipeline": "POST /api/run_pipeline/{ticket_id}",
-            "get_ticket": "GET /api/tickets/{ticket_id}",
-            "get_audit": "GET /api/tickets/{ticket_id}/audit",
-            "list_tickets": "GET /api/tickets",
-            "ingest_message": "POST /api/ingest-message",
-            "telegram_webhook": "POST /telegram/webhook"
-        }
-    }
+    return Response(ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
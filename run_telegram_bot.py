@@ -13,35 +13,40 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+logger = logging.getLogger(__name__)
+
 
 async def main():
     try:
         # Garantir conexão e índices
-        print("🔌 Conectando ao banco de dados...")
+        logger.info("🔌 Conectando ao banco de dados...")
         await ensure_indexes()
-        print("✅ Banco de dados conectado e índices verificados")
+        logger.info("✅ Banco de dados conectado e índices verificados")
         
         bot = TelegramBot()
-        print("\n🤖 Bot Telegram iniciado!")
-        print("====================================")
-        print("📱 Registro de telefone: OBRIGATÓRIO")
-        print("🏢 Saudação: Personalizada por empresa")
-        print("⏰ Rate limit: Ativo")
-        print("🌙 Fora de horário: Aviso + processamento normal")
-        print("====================================")
-        print("\nPressione Ctrl+C para parar")
+        logger.info("🤖 Bot Telegram iniciado!")
+        logger.info("📱 Registro de telefone: OBRIGATÓRIO")
+        logger.info("🏢 Saudação: Personalizada por empresa")
+        logger.info("⏰ Rate limit: Ativo")
+        logger.info("🌙 Fora de horário: Aviso + processamento normal")
+        logger.info("Pressione Ctrl+C para parar")
         
         await bot.start_polling()
         
     except Exception as e:
-        print(f"❌ Erro fatal: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Erro fatal: %s", e)
 
 if __name__ == "__main__":
+    # uvloop (instalado junto com uvicorn[standard]) reduz o overhead do event loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\n👋 Bot encerrado pelo usuário")
+        logger.info("👋 Bot encerrado pelo usuário")
     except Exception as e:
-        print(f"\n❌ Erro: {e}")
+        logger.error("❌ Erro: %s", e)
@@ -6,11 +6,18 @@ solving the bootstrap problem where you need an API key to create API keys.
 
 Usage:
     python scripts/create_initial_api_key.py --company-id techcorp_001 --name "Initial Key"
+    python scripts/create_initial_api_key.py --batch-file keys.json
+
+The batch file is a JSON list of {"company_id": ..., "name": ...} objects.
 """
 import asyncio
 import argparse
+import json
 import sys
 import os
+from typing import Dict, List
+
+from pymongo import InsertOne
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,10 +36,10 @@ async def create_initial_key(company_id: str, name: str):
     """
     collection = get_collection(COLLECTION_API_KEYS)
 
-    # Check if company already has keys
-    existing_count = await collection.count_documents({"company_id": company_id})
-    if existing_count > 0:
-        print(f"\n⚠️  Warning: Company '{company_id}' already has {existing_count} API key(s).")
+    # Check if company already has keys (stops at the first match on the company_id index)
+    existing_key = await collection.find_one({"company_id": company_id}, projection={"_id": 1})
+    if existing_key is not None:
+        print(f"\n⚠️  Warning: Company '{company_id}' already has API key(s).")
         proceed = input("Do you want to create another key? (y/n): ")
         if proceed.lower() != 'y':
             print("Aborted.")
@@ -67,15 +74,59 @@ async def create_initial_key(company_id: str, name: str):
     print(f"\n{'='*80}\n")
 
 
+# Max operations sent per bulk_write call
+BULK_CHUNK_SIZE = 1000
+
+
+async def create_initial_keys_batch(rows: List[Dict[str, str]]):
+    """
+    Create initial API keys for many companies in bulk
+
+    Args:
+        rows: List of {"company_id": ..., "name": ...} entries
+    """
+    collection = get_collection(COLLECTION_API_KEYS)
+
+    api_keys = [
+        APIKey(
+            company_id=row["company_id"],
+            name=row.get("name", "Initial API Key"),
+            permissions=["read", "write", "admin"]
+        )
+        for row in rows
+    ]
+
+    inserted = 0
+    for start in range(0, len(api_keys), BULK_CHUNK_SIZE):
+        chunk = api_keys[start:start + BULK_CHUNK_SIZE]
+        result = await collection.bulk_write(
+            [InsertOne(api_key.dict()) for api_key in chunk],
+            ordered=False
+        )
+        inserted += result.inserted_count
+
+    print(f"\n{'='*80}")
+    print(f"✅ {inserted} API key(s) created successfully!")
+    print(f"{'='*80}\n")
+    for api_key in api_keys:
+        print(f"  {api_key.company_id:<24} {api_key.key_id:<22} {api_key.api_key}")
+    print(f"\n⚠️  IMPORTANT: Save these API keys securely. They won't be shown again.")
+    print(f"\n{'='*80}\n")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Create initial API key for a company (bootstrap)"
     )
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         "--company-id",
-        required=True,
         help="Company identifier (e.g., techcorp_001)"
     )
+    target.add_argument(
+        "--batch-file",
+        help="JSON file with a list of {\"company_id\", \"name\"} entries to create in bulk"
+    )
     parser.add_argument(
         "--name",
         default="Initial API Key",
@@ -84,7 +135,11 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     try:
-        asyncio.run(create_initial_key(args.company_id, args.name))
+        if args.batch_file:
+            with open(args.batch_file, "r", encoding="utf-8") as f:
+                asyncio.run(create_initial_keys_batch(json.load(f)))
+        else:
+            asyncio.run(create_initial_key(args.company_id, args.name))
     except KeyboardInterrupt:
         print("\n\nAborted by user.")
     except Exception as e:
@@ -19,25 +19,35 @@ Requirements:
 """
 
 import argparse
+import base64
 import json
+import logging
 import os
 import subprocess
 import sys
-import time
-from typing import Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 try:
     import boto3
-    from botocore.exceptions import ClientError
+    from botocore.exceptions import ClientError, WaiterError
 except ImportError:
     print("ERROR: boto3 not installed. Run: pip install boto3")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 
 class ECSDeployer:
     """AWS ECS deployment orchestrator"""
 
+    # Poll interval of the services_stable waiter
+    WAITER_DELAY_SECONDS = 6
+    # How often a human-readable status line is printed while waiting
+    PROGRESS_INTERVAL_SECONDS = 15
+
     def __init__(
         self,
         region: str,
@@ -67,17 +77,50 @@ class ECSDeployer:
 
     def _get_image_tag(self) -> str:
         """Generate image tag from git commit hash and timestamp"""
-        try:
-            git_hash = subprocess.check_output(
-                ["git", "rev-parse", "--short", "HEAD"],
-                stderr=subprocess.STDOUT
-            ).decode().strip()
-        except subprocess.CalledProcessError:
-            git_hash = "unknown"
+        git_hash = self._read_git_head() or "unknown"
 
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         return f"{self.environment}-{git_hash}-{timestamp}"
 
+    @staticmethod
+    def _read_git_head() -> Optional[str]:
+        """
+        Read the short commit hash of HEAD straight from the .git directory.
+
+        Handles attached HEAD (loose or packed ref) and detached HEAD without
+        spawning a git process. Returns None when it cannot be resolved.
+        """
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        git_dir = os.path.join(project_root, ".git")
+
+        try:
+            # Worktrees/submodules use a ".git" file pointing at the real git dir
+            if os.path.isfile(git_dir):
+                with open(git_dir) as f:
+                    git_dir = os.path.join(project_root, f.read().strip().split("gitdir: ", 1)[1])
+
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+
+            if not head.startswith("ref: "):
+                return head[:7]
+
+            ref = head[len("ref: "):]
+            ref_path = os.path.join(git_dir, ref)
+            if os.path.exists(ref_path):
+                with open(ref_path) as f:
+                    return f.read().strip()[:7]
+
+            with open(os.path.join(git_dir, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.strip().partition(" ")
+                    if name == ref:
+                        return sha[:7]
+        except (OSError, IndexError):
+            pass
+
+        return None
+
     def create_ecr_repository(self) -> str:
         """Create ECR repository if it doesn't exist"""
         print(f"\n[1/6] Checking ECR repository: {self.repository_name}")
@@ -118,35 +161,64 @@ class ECSDeployer:
         token = login_response["authorizationData"][0]["authorizationToken"]
         endpoint = login_response["authorizationData"][0]["proxyEndpoint"]
 
-        # Docker login to ECR
+        # Docker login to ECR (token is base64 "AWS:<password>")
+        username, password = base64.b64decode(token).decode().split(":", 1)
         subprocess.run(
-            f"aws ecr get-login-password --region {self.region} | "
-            f"docker login --username AWS --password-stdin {endpoint}",
-            shell=True,
+            ["docker", "login", "--username", username, "--password-stdin", endpoint],
+            input=password.encode(),
             check=True
         )
 
-        # Build image
-        print(f"Building image: {self.ecr_image_uri}")
-        subprocess.run(
-            ["docker", "build", "-t", self.ecr_image_uri, "."],
-            check=True
-        )
-
-        # Tag as latest for environment
         latest_tag = f"{self.account_id}.dkr.ecr.{self.region}.amazonaws.com/{self.repository_name}:{self.environment}-latest"
-        subprocess.run(
-            ["docker", "tag", self.ecr_image_uri, latest_tag],
-            check=True
-        )
 
-        # Push both tags
-        print(f"Pushing image to ECR...")
-        subprocess.run(["docker", "push", self.ecr_image_uri], check=True)
-        subprocess.run(["docker", "push", latest_tag], check=True)
+        if self._buildx_available():
+            # BuildKit reuses layers from the previous {env}-latest image in ECR and
+            # pushes both tags in the same invocation
+            print(f"Building image with BuildKit cache from: {latest_tag}")
+            subprocess.run(
+                [
+                    "docker", "buildx", "build",
+                    "--cache-from", f"type=registry,ref={latest_tag}",
+                    "--cache-to", "type=inline",
+                    "--tag", self.ecr_image_uri,
+                    "--tag", latest_tag,
+                    "--push",
+                    ".",
+                ],
+                check=True
+            )
+        else:
+            # Build image
+            print(f"Building image: {self.ecr_image_uri}")
+            subprocess.run(
+                ["docker", "build", "-t", self.ecr_image_uri, "."],
+                check=True
+            )
+
+            # Tag as latest for environment
+            subprocess.run(
+                ["docker", "tag", self.ecr_image_uri, latest_tag],
+                check=True
+            )
+
+            # Push both tags concurrently
+            print(f"Pushing image to ECR...")
+            pushes = {
+                tag: subprocess.Popen(["docker", "push", tag])
+                for tag in (self.ecr_image_uri, latest_tag)
+            }
+            failed = [tag for tag, proc in pushes.items() if proc.wait() != 0]
+            if failed:
+                raise RuntimeError(f"docker push failed for: {', '.join(failed)}")
 
         print(f"✓ Image pushed: {self.ecr_image_uri}")
 
+    @staticmethod
+    def _buildx_available() -> bool:
+        """Check whether the docker buildx plugin is installed"""
+        result = subprocess.run(["docker", "buildx", "version"], capture_output=True)
+        return result.returncode == 0
+
     def create_log_group(self):
         """Create CloudWatch log group for ECS"""
         log_group_name = f"/ecs/customer-support-{self.environment}"
@@ -164,9 +236,6 @@ class ECSDeployer:
         """Register new ECS task definition"""
         print(f"\n[3/6] Registering ECS task definition")
 
-        # Create log group first
-        self.create_log_group()
-
         task_definition = {
             "family": f"customer-support-{self.environment}",
             "networkMode": "awsvpc",
@@ -273,60 +342,111 @@ class ECSDeployer:
             else:
                 raise
 
-    def wait_for_deployment(self, timeout: int = 600):
-        """Wait for ECS deployment to complete"""
+    def wait_for_deployment(self, timeout: int = 600) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Wait for ECS deployment to complete
+
+        Returns:
+            (success, service) where service is the entry from the waiter's
+            last describe_services poll, so callers don't need to describe
+            the service again
+        """
         print(f"\n[5/6] Monitoring deployment (timeout: {timeout}s)")
 
-        start_time = time.time()
-        while True:
-            if time.time() - start_time > timeout:
-                print("⚠ Deployment timeout reached")
-                return False
+        # Status lines are printed from a side thread; the waiter itself only
+        # returns once the service is stable (single PRIMARY deployment, all
+        # tasks running) or a terminal failure is reported
+        stop_progress = threading.Event()
+        progress_thread = threading.Thread(
+            target=self._report_deployment_progress,
+            args=(stop_progress,),
+            daemon=True,
+        )
+        progress_thread.start()
 
-            response = self.ecs_client.describe_services(
-                cluster=self.cluster_name,
-                services=[self.service_name]
-            )
+        # The waiter doesn't return its final response on success, so keep the
+        # describe_services result of each of its polls; the progress thread
+        # shares the client, hence the thread check
+        waiter_thread = threading.get_ident()
+        last_poll: Dict[str, Any] = {}
 
-            if not response["services"]:
-                print("⚠ Service not found")
-                return False
+        def _capture_poll(parsed, **kwargs):
+            if threading.get_ident() == waiter_thread:
+                last_poll["response"] = parsed
 
-            service = response["services"][0]
-            deployments = service["deployments"]
+        events = self.ecs_client.meta.events
+        events.register("after-call.ecs.DescribeServices", _capture_poll)
 
-            # Check if only one deployment (new one)
-            if len(deployments) == 1 and deployments[0]["status"] == "PRIMARY":
-                running_count = deployments[0]["runningCount"]
-                desired_count = deployments[0]["desiredCount"]
+        waiter = self.ecs_client.get_waiter("services_stable")
+        try:
+            waiter.wait(
+                cluster=self.cluster_name,
+                services=[self.service_name],
+                WaiterConfig={
+                    "Delay": self.WAITER_DELAY_SECONDS,
+                    "MaxAttempts": max(1, timeout // self.WAITER_DELAY_SECONDS),
+                },
+            )
+        except WaiterError as e:
+            last_response = e.last_response or {}
+            print(f"⚠ Deployment did not stabilize: {last_response.get('failures') or e}")
+            services = last_response.get("services") or [None]
+            return False, services[0]
+        finally:
+            events.unregister("after-call.ecs.DescribeServices", _capture_poll)
+            stop_progress.set()
+            progress_thread.join()
+
+        service = (last_poll.get("response", {}).get("services") or [None])[0]
+        print(f"✓ Deployment completed successfully!")
+        if service:
+            print(f"  Running tasks: {service['runningCount']}/{service['desiredCount']}")
+        return True, service
+
+    def _describe_service(self) -> Optional[Dict[str, Any]]:
+        """Fetch the current service description, or None if it doesn't exist"""
+        response = self.ecs_client.describe_services(
+            cluster=self.cluster_name,
+            services=[self.service_name]
+        )
+        return response["services"][0] if response["services"] else None
+
+    def _report_deployment_progress(self, stop: threading.Event):
+        """Print deployment status periodically until stop is set"""
+        while not stop.wait(self.PROGRESS_INTERVAL_SECONDS):
+            try:
+                response = self.ecs_client.describe_services(
+                    cluster=self.cluster_name,
+                    services=[self.service_name]
+                )
+            except ClientError:
+                continue
 
-                if running_count == desired_count:
-                    print(f"✓ Deployment completed successfully!")
-                    print(f"  Running tasks: {running_count}/{desired_count}")
-                    return True
+            if not response["services"]:
+                continue
 
-            # Print status
+            deployments = response["services"][0]["deployments"]
             print(f"  Deployments: {len(deployments)}, Status: {deployments[0]['status']}, "
                   f"Running: {deployments[0]['runningCount']}/{deployments[0]['desiredCount']}")
 
-            time.sleep(10)
+    def get_service_info(self, service: Optional[Dict[str, Any]] = None):
+        """
+        Get and display service information
 
-    def get_service_info(self):
-        """Get and display service information"""
+        Args:
+            service: Service description already fetched by wait_for_deployment;
+                describe_services is only called when it is not provided
+        """
         print(f"\n[6/6] Service Information")
 
         try:
-            response = self.ecs_client.describe_services(
-                cluster=self.cluster_name,
-                services=[self.service_name]
-            )
+            if service is None:
+                service = self._describe_service()
 
-            if not response["services"]:
+            if service is None:
                 print("⚠ Service not found")
                 return
 
-            service = response["services"][0]
-
             print(f"\nService: {service['serviceName']}")
             print(f"Status: {service['status']}")
             print(f"Running tasks: {service['runningCount']}/{service['desiredCount']}")
@@ -353,11 +473,19 @@ class ECSDeployer:
         print("=" * 60)
 
         try:
-            # Step 1: Create ECR repository
-            self.create_ecr_repository()
+            # ECR repository and CloudWatch log group are independent, so they are
+            # created concurrently; the log group also overlaps with the image build
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 1: Create ECR repository (+ log group in the background)
+                repo_future = executor.submit(self.create_ecr_repository)
+                log_group_future = executor.submit(self.create_log_group)
+                repo_future.result()
 
-            # Step 2: Build and push image
-            self.build_and_push_image()
+                # Step 2: Build and push image
+                self.build_and_push_image()
+
+                # Log group must exist before the task definition references it
+                log_group_future.result()
 
             # Step 3: Register task definition
             task_def_arn = self.register_task_definition(secrets={})
@@ -370,10 +498,10 @@ class ECSDeployer:
                 return False
 
             # Step 5: Wait for deployment
-            success = self.wait_for_deployment()
+            success, service = self.wait_for_deployment()
 
             # Step 6: Show service info
-            self.get_service_info()
+            self.get_service_info(service)
 
             if success:
                 print("\n" + "=" * 60)
@@ -387,9 +515,7 @@ class ECSDeployer:
             return success
 
         except Exception as e:
-            print(f"\n❌ Deployment failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Deployment failed: %s", e)
             return False
 
 
@@ -420,6 +546,8 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO").upper(), format="%(message)s")
+
     # Validate AWS credentials
     try:
         boto3.client("sts").get_caller_identity()
@@ -24,36 +24,74 @@ Prerequisites:
 """
 
 import argparse
+import logging
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import List, Dict, Any, Optional
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     print("ERROR: boto3 not installed. Run: pip install boto3")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+
+# Shared by every client: bigger pool for concurrent calls, adaptive retries
+# for API throttling and keepalive on the reused connections
+BOTO_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
 
 class ECSInfrastructureSetup:
     """AWS ECS infrastructure orchestrator"""
 
-    def __init__(self, region: str, environment: str):
+    def __init__(self, region: str, environment: str, spot_weight: int = 0):
         self.region = region
         self.environment = environment
+        self.spot_weight = spot_weight
         self.cluster_name = f"customer-support-{environment}"
         self.service_name = f"customer-support-api-{environment}"
 
-        # AWS clients
-        self.ec2 = boto3.client("ec2", region_name=region)
-        self.ecs = boto3.client("ecs", region_name=region)
-        self.elbv2 = boto3.client("elbv2", region_name=region)
-        self.autoscaling = boto3.client("application-autoscaling", region_name=region)
-
-        # Get account ID
-        sts = boto3.client("sts")
-        self.account_id = sts.get_caller_identity()["Account"]
+        # AWS clients (one session so credentials/endpoints are resolved once)
+        self._session = boto3.session.Session(region_name=region)
+        self.ec2 = self._session.client("ec2", config=BOTO_CONFIG)
+        self.ecs = self._session.client("ecs", config=BOTO_CONFIG)
+        self.elbv2 = self._session.client("elbv2", config=BOTO_CONFIG)
+        self.autoscaling = self._session.client("application-autoscaling", config=BOTO_CONFIG)
+
+        # describe_clusters results by cluster name, looked up once per run
+        self._cluster_arns: Dict[str, str] = {}
+
+        # Worker pool shared by every fan-out phase (sized to the client connection pool)
+        self._pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+
+    def close(self):
+        """Shut down the shared worker pool"""
+        self._pool.shutdown(wait=True)
+
+    @cached_property
+    def account_id(self) -> str:
+        """AWS account ID (resolved via STS on first access only)"""
+        sts = self._session.client("sts", config=BOTO_CONFIG)
+        return sts.get_caller_identity()["Account"]
+
+    def has_credentials(self) -> bool:
+        """Check that credentials resolve locally, without an STS round-trip"""
+        credentials = self._session.get_credentials()
+        if credentials is None:
+            return False
+        frozen = credentials.get_frozen_credentials()
+        return bool(frozen.access_key and frozen.secret_key)
 
     def create_vpc(self) -> Dict[str, Any]:
         """Create VPC with public and private subnets"""
@@ -73,9 +111,15 @@ class ECSInfrastructureSetup:
         vpc_id = vpc["Vpc"]["VpcId"]
         print(f"✓ Created VPC: {vpc_id}")
 
-        # Enable DNS
-        self.ec2.modify_vpc_attribute(VpcId=vpc_id, EnableDnsSupport={"Value": True})
-        self.ec2.modify_vpc_attribute(VpcId=vpc_id, EnableDnsHostnames={"Value": True})
+        # Enable DNS (ModifyVpcAttribute takes one attribute per call, so run both at once)
+        dns_support = self._pool.submit(
+            self.ec2.modify_vpc_attribute, VpcId=vpc_id, EnableDnsSupport={"Value": True}
+        )
+        dns_hostnames = self._pool.submit(
+            self.ec2.modify_vpc_attribute, VpcId=vpc_id, EnableDnsHostnames={"Value": True}
+        )
+        dns_support.result()
+        dns_hostnames.result()
 
         # Create Internet Gateway
         igw = self.ec2.create_internet_gateway(
@@ -89,34 +133,7 @@ class ECSInfrastructureSetup:
         print(f"✓ Created Internet Gateway: {igw_id}")
 
         # Get availability zones
-        azs = self.ec2.describe_availability_zones(
-            Filters=[{"Name": "state", "Values": ["available"]}]
-        )["AvailabilityZones"][:2]
-
-        # Create public subnets
-        public_subnets = []
-        for i, az in enumerate(azs):
-            subnet = self.ec2.create_subnet(
-                VpcId=vpc_id,
-                CidrBlock=f"10.0.{i}.0/24",
-                AvailabilityZone=az["ZoneName"],
-                TagSpecifications=[{
-                    "ResourceType": "subnet",
-                    "Tags": [
-                        {"Key": "Name", "Value": f"customer-support-public-{i+1}"},
-                        {"Key": "Type", "Value": "public"}
-                    ]
-                }]
-            )
-            subnet_id = subnet["Subnet"]["SubnetId"]
-            public_subnets.append(subnet_id)
-
-            # Enable auto-assign public IP
-            self.ec2.modify_subnet_attribute(
-                SubnetId=subnet_id,
-                MapPublicIpOnLaunch={"Value": True}
-            )
-            print(f"✓ Created public subnet: {subnet_id} ({az['ZoneName']})")
+        azs = self._availability_zones
 
         # Create route table for public subnets
         route_table = self.ec2.create_route_table(
@@ -135,9 +152,11 @@ class ECSInfrastructureSetup:
             GatewayId=igw_id
         )
 
-        # Associate route table with subnets
-        for subnet_id in public_subnets:
-            self.ec2.associate_route_table(RouteTableId=route_table_id, SubnetId=subnet_id)
+        # Create public subnets (one per AZ, provisioned concurrently)
+        public_subnets = list(self._pool.map(
+            lambda item: self._provision_public_subnet(vpc_id, item[0], item[1], route_table_id),
+            enumerate(azs)
+        ))
 
         print(f"✓ VPC setup complete")
 
@@ -147,6 +166,41 @@ class ECSInfrastructureSetup:
             "igw_id": igw_id
         }
 
+    @cached_property
+    def _availability_zones(self) -> tuple:
+        """Names of the first two available AZs (looked up once per run)"""
+        response = self.ec2.describe_availability_zones(
+            Filters=[{"Name": "state", "Values": ["available"]}]
+        )
+        return tuple(az["ZoneName"] for az in response["AvailabilityZones"][:2])
+
+    def _provision_public_subnet(self, vpc_id: str, index: int, az_name: str, route_table_id: str) -> str:
+        """Create a public subnet in one AZ and attach it to the public route table"""
+        subnet = self.ec2.create_subnet(
+            VpcId=vpc_id,
+            CidrBlock=f"10.0.{index}.0/24",
+            AvailabilityZone=az_name,
+            TagSpecifications=[{
+                "ResourceType": "subnet",
+                "Tags": [
+                    {"Key": "Name", "Value": f"customer-support-public-{index+1}"},
+                    {"Key": "Type", "Value": "public"}
+                ]
+            }]
+        )
+        subnet_id = subnet["Subnet"]["SubnetId"]
+
+        # Enable auto-assign public IP
+        self.ec2.modify_subnet_attribute(
+            SubnetId=subnet_id,
+            MapPublicIpOnLaunch={"Value": True}
+        )
+
+        # Associate route table with subnet
+        self.ec2.associate_route_table(RouteTableId=route_table_id, SubnetId=subnet_id)
+        print(f"✓ Created public subnet: {subnet_id} ({az_name})")
+        return subnet_id
+
     def create_security_groups(self, vpc_id: str) -> Dict[str, str]:
         """Create security groups for ALB and ECS tasks"""
         print("\n[2/7] Creating security groups...")
@@ -216,13 +270,17 @@ class ECSInfrastructureSetup:
         """Create ECS cluster"""
         print(f"\n[3/7] Creating ECS cluster: {self.cluster_name}")
 
+        # One on-demand task is always kept as base; extra tasks are split
+        # FARGATE:FARGATE_SPOT as 1:spot_weight
+        strategy = [{"capacityProvider": "FARGATE", "weight": 1, "base": 1}]
+        if self.spot_weight > 0:
+            strategy.append({"capacityProvider": "FARGATE_SPOT", "weight": self.spot_weight})
+
         try:
             response = self.ecs.create_cluster(
                 clusterName=self.cluster_name,
                 capacityProviders=["FARGATE", "FARGATE_SPOT"],
-                defaultCapacityProviderStrategy=[
-                    {"capacityProvider": "FARGATE", "weight": 1, "base": 1}
-                ],
+                defaultCapacityProviderStrategy=strategy,
                 tags=[
                     {"key": "Environment", "value": self.environment},
                     {"key": "Application", "value": "customer-support-multiagent"}
@@ -234,10 +292,16 @@ class ECSInfrastructureSetup:
         except ClientError as e:
             if "ClusterAlreadyExists" in str(e):
                 print(f"✓ Cluster already exists: {self.cluster_name}")
-                response = self.ecs.describe_clusters(clusters=[self.cluster_name])
-                return response["clusters"][0]["clusterArn"]
+                return self._cluster_arn(self.cluster_name)
             raise
 
+    def _cluster_arn(self, cluster_name: str) -> str:
+        """ARN of an existing cluster (looked up once per run)"""
+        if cluster_name not in self._cluster_arns:
+            response = self.ecs.describe_clusters(clusters=[cluster_name])
+            self._cluster_arns[cluster_name] = response["clusters"][0]["clusterArn"]
+        return self._cluster_arns[cluster_name]
+
     def create_load_balancer(self, vpc_id: str, subnet_ids: List[str], sg_id: str) -> Dict[str, str]:
         """Create Application Load Balancer"""
         print("\n[4/7] Creating Application Load Balancer...")
@@ -291,6 +355,14 @@ class ECSInfrastructureSetup:
         )
         print(f"✓ Created Listener (HTTP:80 -> Target Group)")
 
+        # Target group and listener are created while the ALB provisions;
+        # wait for it to become active before the service is attached
+        self.elbv2.get_waiter("load_balancer_available").wait(
+            LoadBalancerArns=[alb_arn],
+            WaiterConfig={"Delay": 5, "MaxAttempts": 40}
+        )
+        print(f"✓ ALB is active")
+
         return {
             "alb_arn": alb_arn,
             "alb_dns": alb_dns,
@@ -308,13 +380,17 @@ class ECSInfrastructureSetup:
         """Create ECS service"""
         print(f"\n[5/7] Creating ECS service: {self.service_name}")
 
+        # An explicit launch type overrides the cluster's capacity provider
+        # strategy, so it is only set when Fargate Spot is not in use
+        launch_options = {} if self.spot_weight > 0 else {"launchType": "FARGATE"}
+
         try:
             response = self.ecs.create_service(
                 cluster=cluster_arn,
                 serviceName=self.service_name,
                 taskDefinition=task_definition,
                 desiredCount=1,
-                launchType="FARGATE",
+                **launch_options,
                 platformVersion="LATEST",
                 networkConfiguration={
                     "awsvpcConfiguration": {
@@ -447,6 +523,12 @@ def main():
         "--subnet-ids",
         help="Comma-separated subnet IDs (required if using existing VPC)"
     )
+    parser.add_argument(
+        "--spot-weight",
+        type=int,
+        default=0,
+        help="FARGATE_SPOT weight relative to FARGATE (weight 1, base 1) in the cluster default strategy (default: 0, on-demand only)"
+    )
     parser.add_argument(
         "--task-definition",
         default="customer-support-production:1",
@@ -455,19 +537,28 @@ def main():
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO").upper(), format="%(message)s")
+
     if not args.create_vpc and not args.vpc_id:
         print("ERROR: Specify --create-vpc or --vpc-id")
         sys.exit(1)
 
+    if args.spot_weight < 0:
+        print("ERROR: --spot-weight must be >= 0")
+        sys.exit(1)
+
+    # Create setup instance
+    setup = ECSInfrastructureSetup(region=args.region, environment=args.env, spot_weight=args.spot_weight)
+
     # Validate AWS credentials
     try:
-        boto3.client("sts").get_caller_identity()
+        configured = setup.has_credentials()
     except Exception as e:
         print(f"❌ AWS credentials not configured: {e}")
         sys.exit(1)
-
-    # Create setup instance
-    setup = ECSInfrastructureSetup(region=args.region, environment=args.env)
+    if not configured:
+        print("❌ AWS credentials not configured")
+        sys.exit(1)
 
     resources = {}
 
@@ -513,10 +604,10 @@ def main():
         setup.print_summary(resources)
 
     except Exception as e:
-        print(f"\n❌ Setup failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Setup failed: %s", e)
         sys.exit(1)
+    finally:
+        setup.close()
 
 
 if __name__ == "__main__":
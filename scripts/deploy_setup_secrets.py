@@ -19,60 +19,106 @@ import argparse
 import json
 import sys
 import os
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     print("ERROR: boto3 not installed. Run: pip install boto3")
     sys.exit(1)
 
 
+# Bigger pool, adaptive retries for API throttling and TCP keepalive
+BOTO_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
 class SecretsManager:
     """AWS Secrets Manager helper"""
 
     def __init__(self, region: str, environment: str):
         self.region = region
         self.environment = environment
-        self.client = boto3.client("secretsmanager", region_name=region)
+        self._session = boto3.session.Session(region_name=region)
+        self.client = self._session.client("secretsmanager", config=BOTO_CONFIG)
         self.prefix = f"customer-support/{environment}"
 
-    def create_or_update_secret(self, name: str, value: str, description: str = ""):
-        """Create or update a secret"""
-        secret_name = f"{self.prefix}/{name}"
-
+    def create_or_update_secret(self, name: str, value: str, description: str = "") -> Optional[str]:
+        """Create or update a secret, skipping the write if the value is unchanged; returns a new ARN if created"""
         try:
-            # Try to update existing secret
-            self.client.update_secret(
-                SecretId=secret_name,
-                SecretString=value
-            )
-            print(f"✓ Updated secret: {secret_name}")
+            current = self.client.get_secret_value(SecretId=f"{self.prefix}/{name}")
         except ClientError as e:
-            if e.response["Error"]["Code"] == "ResourceNotFoundException":
-                # Create new secret
-                self.client.create_secret(
-                    Name=secret_name,
-                    Description=description or f"{name} for {self.environment}",
-                    SecretString=value,
-                    Tags=[
-                        {"Key": "Environment", "Value": self.environment},
-                        {"Key": "Application", "Value": "customer-support-multiagent"},
-                    ]
-                )
-                print(f"✓ Created secret: {secret_name}")
-            else:
+            if e.response["Error"]["Code"] != "ResourceNotFoundException":
                 raise
+            current = None
+
+        return self._apply_secret(name, value, current, description)
 
-    def get_secret_arn(self, name: str) -> str:
-        """Get ARN of a secret"""
+    # Max SecretIdList size accepted by BatchGetSecretValue
+    BATCH_GET_LIMIT = 20
+    # Max secrets created/updated at the same time
+    MAX_CONCURRENT_WRITES = 10
+
+    def get_existing_secrets(self, names) -> Dict[str, Dict[str, Any]]:
+        """Fetch current values of existing secrets in batches, keyed by short name"""
+        secret_ids = [f"{self.prefix}/{name}" for name in names]
+        existing = {}
+
+        for start in range(0, len(secret_ids), self.BATCH_GET_LIMIT):
+            response = self.client.batch_get_secret_value(
+                SecretIdList=secret_ids[start:start + self.BATCH_GET_LIMIT]
+            )
+            for entry in response.get("SecretValues", []):
+                existing[entry["Name"][len(self.prefix) + 1:]] = entry
+
+            # Per-secret failures are reported under "Errors" instead of raising;
+            # only "not found" means the secret has to be created
+            for error in response.get("Errors", []):
+                if error.get("ErrorCode") != "ResourceNotFoundException":
+                    raise ClientError(
+                        {"Error": {"Code": error.get("ErrorCode"), "Message": error.get("Message", "")}},
+                        "BatchGetSecretValue",
+                    )
+
+        return existing
+
+    def _apply_secret(
+        self,
+        name: str,
+        value: str,
+        current: Optional[Dict[str, Any]],
+        description: str = "",
+    ) -> Optional[str]:
+        """Create, update or skip one secret given its current value entry; returns a new ARN if created"""
         secret_name = f"{self.prefix}/{name}"
-        try:
-            response = self.client.describe_secret(SecretId=secret_name)
+
+        if current is None:
+            response = self.client.create_secret(
+                Name=secret_name,
+                Description=description or f"{name} for {self.environment}",
+                SecretString=value,
+                Tags=[
+                    {"Key": "Environment", "Value": self.environment},
+                    {"Key": "Application", "Value": "customer-support-multiagent"},
+                ]
+            )
+            print(f"✓ Created secret: {secret_name}")
             return response["ARN"]
-        except ClientError:
-            return ""
+
+        if current.get("SecretString") == value:
+            print(f"✓ Unchanged secret: {secret_name}")
+        else:
+            # New version only; description and tags are left as they are
+            self.client.put_secret_value(SecretId=secret_name, SecretString=value)
+            print(f"✓ Updated secret: {secret_name}")
+        return None
 
     def setup_all_secrets(self, secrets_dict: Dict[str, str]):
         """Setup all required secrets"""
@@ -80,12 +126,27 @@ class SecretsManager:
         print(f"Setting up AWS Secrets Manager - {self.environment}")
         print("=" * 60)
 
+        existing = self.get_existing_secrets(secrets_dict.keys())
+        arns = {name: entry["ARN"] for name, entry in existing.items()}
+
+        to_apply = {}
         for name, value in secrets_dict.items():
             if not value or value == "REQUIRED" or value.startswith("your_"):
                 print(f"⚠ Skipping {name} - no value provided")
                 continue
-
-            self.create_or_update_secret(name, value)
+            to_apply[name] = value
+
+        # Secrets Manager throttles per account, so keep writes to a few at a time
+        if to_apply:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_WRITES, len(to_apply))) as pool:
+                futures = {
+                    name: pool.submit(self._apply_secret, name, value, existing.get(name))
+                    for name, value in to_apply.items()
+                }
+            for name, future in futures.items():
+                arn = future.result()
+                if arn:
+                    arns[name] = arn
 
         print("\n" + "=" * 60)
         print("✓ Secrets setup completed")
@@ -94,21 +155,30 @@ class SecretsManager:
         # Print ARNs for reference
         print("\nSecret ARNs (for ECS task definition):")
         for name in secrets_dict.keys():
-            arn = self.get_secret_arn(name)
+            arn = arns.get(name)
             if arn:
                 print(f"  {name}: {arn}")
 
 
+@lru_cache(maxsize=None)
+def load_env_file():
+    """Load .env once; skipped when a parent process already loaded it"""
+    if os.getenv("DOTENV_LOADED") == "1":
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv(dotenv_path=".env", override=False)
+    os.environ["DOTENV_LOADED"] = "1"
+
+
 def load_secrets_from_env() -> Dict[str, str]:
     """Load secrets from environment variables or .env file"""
     secrets = {}
 
     # Try to load from .env file
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
+    load_env_file()
 
     # Required secrets
     secret_mapping = {
@@ -4,7 +4,7 @@ Script to ingest documents into the Knowledge Base
 import sys
 import os
 import asyncio
-import glob
+from typing import Optional
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -13,37 +13,76 @@ from src.rag.knowledge_base import knowledge_base
 # Optional: import PDF loader if needed, but for now we'll do simple text/md
 # from langchain_community.document_loaders import PyPDFLoader
 
-async def ingest_file(file_path: str, company_id: str):
+# Max files ingested at the same time (caps in-flight embedding requests)
+MAX_CONCURRENT_FILES = 8
+
+TEXT_EXTS = frozenset({'.txt', '.md', '.markdown'})
+PDF_EXTS = frozenset({'.pdf'})
+
+def _extension(filename: str) -> str:
+    _, dot, ext = filename.rpartition('.')
+    return (dot + ext).lower() if dot else ""
+
+def _read_text(file_path: str) -> str:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+async def _ingest_text(file_path: str, filename: str, company_id: str) -> int:
+    content = await asyncio.to_thread(_read_text, file_path)
+    if not content:
+        return 0
+    return await knowledge_base.add_document(
+        content=content,
+        company_id=company_id,
+        source=filename,
+        doc_type="manual"
+    )
+
+async def _ingest_pdf(file_path: str, filename: str, company_id: str) -> int:
+    # Basic PDF text extraction
+    from langchain_community.document_loaders import PyPDFLoader
+    loader = PyPDFLoader(file_path)
+    pages = await asyncio.to_thread(loader.load)
+
+    # Add page by page instead of joining the whole PDF into one string
+    chunks = 0
+    for page in pages:
+        if not page.page_content:
+            continue
+        chunks += await knowledge_base.add_document(
+            content=page.page_content,
+            company_id=company_id,
+            source=f"{filename}#p{page.metadata.get('page', 0)}",
+            doc_type="manual"
+        )
+    return chunks
+
+# File kinds, used as indexes into HANDLERS
+TEXT_KIND = 0
+PDF_KIND = 1
+HANDLERS = (_ingest_text, _ingest_pdf)
+
+EXT_KINDS = {
+    **{ext: TEXT_KIND for ext in TEXT_EXTS},
+    **{ext: PDF_KIND for ext in PDF_EXTS},
+}
+
+async def ingest_file(file_path: str, company_id: str, kind: Optional[int] = None):
+    """Ingest one file; kind is resolved from the extension unless the caller already knows it"""
     print(f"📄 Processing: {file_path}")
     
     filename = os.path.basename(file_path)
-    extension = os.path.splitext(filename)[1].lower()
-    
-    content = ""
-    
-    try:
-        if extension in ['.txt', '.md', '.markdown']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-        elif extension == '.pdf':
-            # Basic PDF text extraction
-            from langchain_community.document_loaders import PyPDFLoader
-            loader = PyPDFLoader(file_path)
-            pages = loader.load()
-            content = "\n".join([p.page_content for p in pages])
-            
-        else:
+
+    if kind is None:
+        extension = _extension(filename)
+        kind = EXT_KINDS.get(extension)
+        if kind is None:
             print(f"⚠️ Skipping unsupported file type: {extension}")
             return
 
-        if content:
-            chunks = await knowledge_base.add_document(
-                content=content,
-                company_id=company_id,
-                source=filename,
-                doc_type="manual"
-            )
+    try:
+        chunks = await HANDLERS[kind](file_path, filename, company_id)
+        if chunks:
             print(f"✅ Ingested {chunks} chunks for {filename}")
         else:
             print(f"⚠️ Warning: No content extracted from {filename}")
@@ -51,6 +90,10 @@ async def ingest_file(file_path: str, company_id: str):
     except Exception as e:
         print(f"❌ Error ingesting {filename}: {e}")
 
+async def _ingest_bounded(sem: asyncio.Semaphore, file_path: str, kind: int, company_id: str):
+    async with sem:
+        await ingest_file(file_path, company_id, kind)
+
 async def run_ingestion(company_id: str = "techcorp_001"):
     print(f"🚀 Starting ingestion for Company: {company_id}")
     
@@ -60,24 +103,31 @@ async def run_ingestion(company_id: str = "techcorp_001"):
         print(f"❌ Directory not found: {docs_dir}")
         return
 
-    # Find all supported files
+    # Find all supported files, tagged with their kind
     files = []
-    for ext in ['*.txt', '*.md', '*.pdf']:
-        files.extend(glob.glob(os.path.join(docs_dir, ext)))
+    with os.scandir(docs_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            kind = EXT_KINDS.get(_extension(entry.name))
+            if kind is not None:
+                files.append((entry.path, kind))
+    files.sort()
     
     if not files:
         print("⚠️ No documents found to ingest.")
         return
         
-    for file_path in files:
-        await ingest_file(file_path, company_id)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FILES)
+    await asyncio.gather(
+        *[_ingest_bounded(sem, file_path, kind, company_id) for file_path, kind in files],
+        return_exceptions=True
+    )
 
     print("✨ Ingestion complete!")
 
 if __name__ == "__main__":
-    from dotenv import load_dotenv
-    load_dotenv()
-    
+    # .env is already loaded by KnowledgeBase when knowledge_base is imported
     if len(sys.argv) > 1:
         c_id = sys.argv[1]
     else:
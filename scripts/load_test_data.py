@@ -2,10 +2,18 @@
 Script to load test data into MongoDB
 """
 import asyncio
-import json
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator, List, Set
+
+import orjson
+from pymongo.errors import BulkWriteError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Add project root to sys.path to enable imports from src
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -26,23 +34,69 @@ from src.models import (
 )
 
 
-async def load_tickets():
-    """Load test tickets from JSON file"""
-    
-    # Read tickets from JSON
-    tickets_file = Path("test_data/tickets.json")
-    with open(tickets_file, "r", encoding="utf-8") as f:
-        tickets_data = json.load(f)
-    
-    tickets_collection = await get_collection(COLLECTION_TICKETS)
-    interactions_collection = await get_collection(COLLECTION_INTERACTIONS)
+# Documents sent per insert_many call
+INSERT_BATCH_SIZE = 200
+# Insert batches in flight at the same time
+MAX_CONCURRENT_BATCHES = 8
+# Fixture files larger than this are streamed with ijson (if installed)
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+async def _insert_batches(collection, docs: List[dict]) -> Set[int]:
+    """
+    Insert documents with unordered insert_many calls.
+
+    Returns:
+        Indexes (into docs) of documents that failed to insert
+    """
+    failed = set()
+    for start in range(0, len(docs), INSERT_BATCH_SIZE):
+        try:
+            await collection.insert_many(docs[start:start + INSERT_BATCH_SIZE], ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed.add(start + error["index"])
+                print(f"Failed to insert document: {error.get('errmsg')}")
+    return failed
+
+
+def _iter_tickets(tickets_file: Path) -> Iterator[dict]:
+    """
+    Yield tickets from the fixture file.
+
+    Small files are parsed in one go with orjson (fastest); files above
+    STREAM_THRESHOLD_BYTES are streamed with ijson, when installed, to keep
+    memory bounded.
+    """
+    with open(tickets_file, "rb") as f:
+        if ijson is not None and tickets_file.stat().st_size > STREAM_THRESHOLD_BYTES:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from orjson.loads(f.read())
+
+
+async def _load_batch(tickets_collection, interactions_collection, tickets_data: List[dict], now: datetime) -> int:
+    """
+    Insert one batch of tickets (and their initial interactions), skipping existing ones.
+
+    Returns:
+        Number of tickets created
+    """
+    # Check which tickets already exist with a single query
+    ids = [t["ticket_id"] for t in tickets_data]
+    existing = {
+        d["ticket_id"]
+        async for d in tickets_collection.find(
+            {"ticket_id": {"$in": ids}}, {"ticket_id": 1, "_id": 0}, hint="ticket_id_1"
+        )
+    }
     
+    ticket_docs = []
+    interaction_docs = []
     for ticket_data in tickets_data:
         ticket_id = ticket_data["ticket_id"]
         
-        # Check if ticket already exists
-        existing = await tickets_collection.find_one({"ticket_id": ticket_id})
-        if existing:
+        if ticket_id in existing:
             print(f"Ticket {ticket_id} already exists, skipping...")
             continue
         
@@ -57,27 +111,73 @@ async def load_tickets():
             "status": ticket_data["status"],
             "current_phase": ticket_data["current_phase"],
             "interactions_count": ticket_data["interactions_count"],
-            "created_at": datetime.fromisoformat(ticket_data["created_at"]) if ticket_data.get("created_at") else datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": datetime.fromisoformat(ticket_data["created_at"]) if ticket_data.get("created_at") else now,
+            "updated_at": now,
             "lock_version": 0
         }
-        
-        # Insert ticket
-        await tickets_collection.insert_one(ticket_dict)
-        print(f"Created ticket: {ticket_id}")
+        ticket_docs.append(ticket_dict)
         
         # Create initial customer message interaction
-        interaction = {
+        interaction_docs.append({
             "ticket_id": ticket_id,
             "type": InteractionType.CUSTOMER_MESSAGE,
             "content": ticket_data["description"],
             "sentiment_score": 0.0,
             "created_at": ticket_dict["created_at"]
-        }
-        
-        await interactions_collection.insert_one(interaction)
-        print(f"Created initial interaction for: {ticket_id}")
+        })
+    
+    if not ticket_docs:
+        return 0
+    
+    # Insert tickets, then only the interactions whose ticket was created
+    failed = await _insert_batches(tickets_collection, ticket_docs)
+    interaction_docs = [doc for i, doc in enumerate(interaction_docs) if i not in failed]
+    await _insert_batches(interactions_collection, interaction_docs)
+    
+    return len(ticket_docs) - len(failed)
+
+
+async def load_tickets():
+    """Load test tickets from JSON file"""
+    
+    tickets_file = Path("test_data/tickets.json")
+    
+    tickets_collection = get_collection(COLLECTION_TICKETS)
+    interactions_collection = get_collection(COLLECTION_INTERACTIONS)
+    
+    # Same unique index ensure_indexes() creates; the script may run before the API ever has
+    await tickets_collection.create_index([("ticket_id", 1)], unique=True)
+    
+    # One timestamp for the whole run (naive UTC, like the rest of the stored dates)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    
+    # Read tickets from JSON and load them INSERT_BATCH_SIZE at a time,
+    # with up to MAX_CONCURRENT_BATCHES batches in flight
+    sem = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+    
+    async def flush(batch: List[dict]) -> int:
+        async with sem:
+            return await _load_batch(tickets_collection, interactions_collection, batch, now)
+    
+    tasks = []
+    batch = []
+    for ticket_data in _iter_tickets(tickets_file):
+        batch.append(ticket_data)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            tasks.append(asyncio.create_task(flush(batch)))
+            batch = []
+            # Let started batches run while the file is still being read
+            await asyncio.sleep(0)
+    if batch:
+        tasks.append(asyncio.create_task(flush(batch)))
+    
+    created = sum(await asyncio.gather(*tasks))
+    
+    if not created:
+        print("\nNo new tickets to load.")
+        return
     
+    print(f"Created {created} ticket(s) with initial interactions")
     print("\nAll test tickets loaded successfully!")
 
 
@@ -85,23 +85,28 @@ async def setup_company():
         "products": products,
         "business_hours": business_hours,
         "bot_name": bot_name,
-        "bot_welcome_message": welcome_message
+        "bot_welcome_message": welcome_message,
+        "custom_instructions": custom_instructions
     }
     
     # Display summary
-    print("\n=== Resumo da Configuração ===")
-    print(f"ID da Empresa: {config_data['company_id']}")
-    print(f"Nome: {config_data['company_name']}")
-    print(f"Email de Suporte: {config_data['support_email'] or 'Não definido'}")
-    print(f"Telefone de Suporte: {config_data['support_phone'] or 'Não definido'}")
-    print(f"Política de Reembolso: {config_data['refund_policy'] or 'Não definida'}")
-    print(f"Política de Cancelamento: {config_data['cancellation_policy'] or 'Não definida'}")
-    print(f"Métodos de Pagamento: {', '.join([pm['name'] for pm in config_data['payment_methods']]) if config_data['payment_methods'] else 'Não definidos'}")
-    print(f"Produtos/Serviços: {len(config_data['products'])} item(ns)")
-    print(f"Horário de Atendimento: {config_data['business_hours'] or 'Não definido'}")
-    print(f"Nome do Bot: {config_data['bot_name'] or 'Padrão'}")
-    print(f"Mensagem de Boas-vindas: {config_data['bot_welcome_message'] or 'Padrão'}")
-    print(f"Instruções Personalizadas: {config_data['custom_instructions'] or 'Nenhuma'}")
+    payment_str = ', '.join(config_data['payment_methods']) if config_data['payment_methods'] else 'Não definidos'
+    lines = [
+        "\n=== Resumo da Configuração ===",
+        f"ID da Empresa: {config_data['company_id']}",
+        f"Nome: {config_data['company_name']}",
+        f"Email de Suporte: {config_data['support_email'] or 'Não definido'}",
+        f"Telefone de Suporte: {config_data['support_phone'] or 'Não definido'}",
+        f"Política de Reembolso: {config_data['refund_policy'] or 'Não definida'}",
+        f"Política de Cancelamento: {config_data['cancellation_policy'] or 'Não definida'}",
+        f"Métodos de Pagamento: {payment_str}",
+        f"Produtos/Serviços: {len(config_data['products'])} item(ns)",
+        f"Horário de Atendimento: {config_data['business_hours'] or 'Não definido'}",
+        f"Nome do Bot: {config_data['bot_name'] or 'Padrão'}",
+        f"Mensagem de Boas-vindas: {config_data['bot_welcome_message'] or 'Padrão'}",
+        f"Instruções Personalizadas: {config_data['custom_instructions'] or 'Nenhuma'}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Confirm
     confirm = input("\n\nCriar configuração? (s/n): ").strip().lower()
@@ -112,12 +117,15 @@ async def setup_company():
     # Create company config via API
     print("\n📡 Criando configuração da empresa...")
     
-    async with httpx.AsyncClient() as client:
+    # Reuse this client (keep-alive) for any further API calls made here
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=5)
+    ) as client:
         try:
             response = await client.post(
                 "http://localhost:8000/api/companies/",
-                json=config_data,
-                timeout=30.0
+                json=config_data
             )
             
             if response.status_code == 200:
@@ -1,6 +1,6 @@
 """
 Channel adapters for external integrations
 """
-from .telegram_adapter import TelegramAdapter
+from .telegram_adapter import TelegramAdapter, WebhookEvent
 
-__all__ = ["TelegramAdapter"]
+__all__ = ["TelegramAdapter", "WebhookEvent"]
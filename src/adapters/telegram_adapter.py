@@ -1,9 +1,195 @@
 """
 Telegram adapter for handling Telegram Bot API webhooks and sending messages
+
+All calls are I/O-bound coroutines, so they run best on uvloop. uvicorn[standard]
+uses it automatically and run_telegram_bot.py installs it; the adapter logs once
+if it finds itself on the default asyncio loop.
 """
-from typing import Dict, Any, Optional
+import asyncio
+import logging
+import re
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Set, Tuple
+import httpx
+import orjson
 from src.config import settings
-from src.utils.http_client import get_http_client
+from src.utils.http_client import get_telegram_client
+
+logger = logging.getLogger(__name__)
+
+# Telegram allows ~30 messages per second per bot across all chats
+SEND_RATE_PER_SECOND = 30
+# Max sendMessage requests in flight at once
+MAX_CONCURRENT_SENDS = 30
+# Retries of a call rejected with 429 Too Many Requests
+MAX_RATE_LIMIT_RETRIES = 5
+# How long a getWebhookInfo response is reused
+WEBHOOK_INFO_TTL_SECONDS = 60
+# How many processed update_ids are remembered to drop Telegram redeliveries
+PROCESSED_UPDATES_MAX = 8192
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously up to `rate` tokens per second"""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._last_refill = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _SendLimits:
+    """Rate limiter, concurrency cap and per-chat locks for one event loop"""
+    
+    __slots__ = ("loop", "bucket", "semaphore", "chat_locks")
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.bucket = _TokenBucket(SEND_RATE_PER_SECOND)
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # One lock per chat so concurrent sends to the same chat arrive in order;
+        # entries disappear once no send to that chat is pending
+        self.chat_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+# Shared by every adapter instance (the limit is per bot, not per request) but
+# rebuilt when the running loop changes: asyncio primitives bind to one loop
+_send_limits: Optional[_SendLimits] = None
+
+
+def _get_send_limits() -> _SendLimits:
+    """Return the send limits for the running event loop, creating them on first use"""
+    global _send_limits
+    loop = asyncio.get_running_loop()
+    if _send_limits is None or _send_limits.loop is not loop:
+        _send_limits = _SendLimits(loop)
+    return _send_limits
+
+# Per-bot-token response caches, shared because adapters are created per request.
+# getMe never changes while the process runs; getWebhookInfo is kept briefly.
+_me_cache: Dict[str, Dict[str, Any]] = {}
+_webhook_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Successfully processed update_ids, oldest first. Per process: with several
+# workers a redelivery can still land on another one.
+_processed_updates: "OrderedDict[int, None]" = OrderedDict()
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Seconds Telegram asked us to wait before retrying a 429"""
+    try:
+        retry_after = orjson.loads(response.content).get("parameters", {}).get("retry_after")
+    except (orjson.JSONDecodeError, AttributeError):
+        retry_after = None
+    if retry_after is None:
+        try:
+            retry_after = int(response.headers.get("Retry-After", 1))
+        except ValueError:
+            retry_after = 1
+    return retry_after
+
+
+# Whether the running event loop has been checked for uvloop
+_loop_checked = False
+
+
+def _check_event_loop() -> None:
+    """Log once if the adapter is used on the default asyncio loop"""
+    global _loop_checked
+    if _loop_checked:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Constructed outside a loop; check again on the next construction
+        return
+    _loop_checked = True
+    if not type(loop).__module__.startswith("uvloop"):
+        logger.info(
+            f"Telegram adapter running on {type(loop).__name__}; "
+            "install uvloop for lower event loop overhead"
+        )
+
+
+# Strong references to fire-and-forget API calls until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_background_done(task: asyncio.Task) -> None:
+    """Forget a finished background call and log its failure, if any"""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background Telegram call failed: {task.exception()}")
+
+
+# Read-only stand-in for missing sub-objects in webhook updates
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+# "<bot id>:<secret>"; only the shape is checked, Telegram validates the rest
+_BOT_TOKEN_RE = re.compile(r"\d+:[A-Za-z0-9_-]+")
+
+_EXTERNAL_ID_PREFIX = sys.intern("telegram:")
+
+
+@lru_cache(maxsize=4096)
+def _external_user_id(user_id: Optional[int]) -> str:
+    """Build (and reuse) the channel-scoped id for a Telegram user"""
+    return f"{_EXTERNAL_ID_PREFIX}{user_id}"
+
+
+def _build_metadata(
+    update: Mapping[str, Any],
+    message: Mapping[str, Any],
+    from_user: Mapping[str, Any],
+    chat: Mapping[str, Any],
+    extra: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Build the metadata dict shared by message and callback updates"""
+    metadata = {
+        "update_id": update.get("update_id"),
+        "message_id": message.get("message_id"),
+        "chat_id": chat.get("id"),
+        "chat_type": chat.get("type"),
+        "username": from_user.get("username"),
+        "first_name": from_user.get("first_name"),
+        "last_name": from_user.get("last_name"),
+    }
+    metadata.update(extra)
+    return metadata
+
+
+@dataclass(slots=True)
+class WebhookEvent:
+    """A parsed Telegram update carrying user text"""
+    external_user_id: str
+    text: str
+    metadata: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, for callers that still expect one"""
+        return {
+            "external_user_id": self.external_user_id,
+            "text": self.text,
+            "metadata": self.metadata,
+        }
 
 
 class TelegramAdapter:
@@ -11,17 +197,51 @@ class TelegramAdapter:
     Adapter for Telegram Bot API integration
     """
     
+    __slots__ = (
+        "bot_token",
+        "api_url",
+        "_url_send_message",
+        "_url_answer_cb",
+        "_url_set_webhook",
+        "_url_get_webhook_info",
+        "_url_delete_webhook",
+        "_url_get_me",
+        "_url_set_my_commands",
+    )
+    
+    # Sent with every request body (pre-serialized by orjson); never mutated
+    _JSON_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+    
     def __init__(self, bot_token: Optional[str] = None):
         """
         Initialize the Telegram adapter
         
         Args:
             bot_token: Telegram bot token (defaults to settings.telegram_bot_token)
+            
+        Raises:
+            RuntimeError: If no token is configured or it is malformed
         """
         self.bot_token = bot_token or getattr(settings, 'telegram_bot_token', None)
-        self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
+        if not self.bot_token:
+            raise RuntimeError("Telegram bot_token not configured")
+        if not _BOT_TOKEN_RE.fullmatch(self.bot_token):
+            raise RuntimeError("Telegram bot_token is malformed")
+        api_base = getattr(settings, 'telegram_api_base', "https://api.telegram.org").rstrip("/")
+        self.api_url = f"{api_base}/bot{self.bot_token}"
+        
+        # Endpoints are fixed for the adapter's lifetime, so build them once
+        self._url_send_message = f"{self.api_url}/sendMessage"
+        self._url_answer_cb = f"{self.api_url}/answerCallbackQuery"
+        self._url_set_webhook = f"{self.api_url}/setWebhook"
+        self._url_get_webhook_info = f"{self.api_url}/getWebhookInfo"
+        self._url_delete_webhook = f"{self.api_url}/deleteWebhook"
+        self._url_get_me = f"{self.api_url}/getMe"
+        self._url_set_my_commands = f"{self.api_url}/setMyCommands"
+        
+        _check_event_loop()
     
-    def parse_webhook_update(self, update: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def parse_webhook_update(self, update: Dict[str, Any]) -> Optional[WebhookEvent]:
         """
         Parse a Telegram webhook update and extract relevant information
         
@@ -29,59 +249,140 @@ class TelegramAdapter:
             update: Telegram webhook update payload
             
         Returns:
-            Dict with external_user_id, text, and metadata, or None if no message
+            WebhookEvent with external_user_id, text, and metadata, or None if no message
         """
         # Extract message from update
-        message = update.get("message", {})
+        message = update.get("message")
         
         if not message:
             # Check for callback_query (button presses)
-            callback_query = update.get("callback_query", {})
+            callback_query = update.get("callback_query")
             if callback_query:
-                message = callback_query.get("message", {})
-                callback_data = callback_query.get("data", "")
-                # Use callback data as text
+                # Use callback data as text; nothing to process without it
+                callback_data = callback_query.get("data")
+                if not callback_data:
+                    return None
+                message = callback_query.get("message")
                 if message:
-                    return {
-                        "external_user_id": f"telegram:{message.get('from', {}).get('id')}",
-                        "text": callback_data,
-                        "metadata": {
-                            "update_id": update.get("update_id"),
-                            "callback_query_id": callback_query.get("id"),
-                            "message_id": message.get("message_id"),
-                            "chat_id": message.get("chat", {}).get("id"),
-                            "chat_type": message.get("chat", {}).get("type"),
-                            "username": message.get("from", {}).get("username"),
-                            "first_name": message.get("from", {}).get("first_name"),
-                            "last_name": message.get("from", {}).get("last_name"),
-                        }
-                    }
+                    from_user = message.get("from") or _EMPTY
+                    chat = message.get("chat") or _EMPTY
+                    return WebhookEvent(
+                        external_user_id=_external_user_id(from_user.get("id")),
+                        text=callback_data,
+                        metadata=_build_metadata(
+                            update, message, from_user, chat,
+                            {"callback_query_id": callback_query.get("id")}
+                        )
+                    )
             return None
         
-        # Extract user and chat information
-        from_user = message.get("from", {})
-        chat = message.get("chat", {})
-        
         # Get text from message
         text = message.get("text") or message.get("caption", "")
         
         if not text:
             return None
         
-        return {
-            "external_user_id": f"telegram:{from_user.get('id')}",
-            "text": text,
-            "metadata": {
-                "update_id": update.get("update_id"),
-                "message_id": message.get("message_id"),
-                "chat_id": chat.get("id"),
-                "chat_type": chat.get("type"),
-                "username": from_user.get("username"),
-                "first_name": from_user.get("first_name"),
-                "last_name": from_user.get("last_name"),
-                "language_code": from_user.get("language_code"),
-            }
-        }
+        # Extract user and chat information
+        from_user = message.get("from") or _EMPTY
+        chat = message.get("chat") or _EMPTY
+        
+        return WebhookEvent(
+            external_user_id=_external_user_id(from_user.get("id")),
+            text=text,
+            metadata=_build_metadata(
+                update, message, from_user, chat,
+                {"language_code": from_user.get("language_code")}
+            )
+        )
+    
+    def is_duplicate(self, update_id: Optional[int]) -> bool:
+        """
+        Check whether an update was already processed successfully
+        
+        Telegram redelivers an update when the webhook fails or times out;
+        only updates recorded with mark_processed() count as duplicates, so a
+        failed delivery is processed again.
+        
+        Args:
+            update_id: Telegram update_id (None is never a duplicate)
+            
+        Returns:
+            True if the update should be skipped
+        """
+        if update_id is None or update_id not in _processed_updates:
+            return False
+        _processed_updates.move_to_end(update_id)
+        return True
+    
+    def mark_processed(self, update_id: Optional[int]) -> None:
+        """
+        Record an update as processed so redeliveries are skipped
+        
+        Args:
+            update_id: Telegram update_id (None is ignored)
+        """
+        if update_id is None:
+            return
+        _processed_updates[update_id] = None
+        _processed_updates.move_to_end(update_id)
+        if len(_processed_updates) > PROCESSED_UPDATES_MAX:
+            _processed_updates.popitem(last=False)
+    
+    async def _call(
+        self,
+        verb: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        throttled: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make a Bot API request and return the decoded response
+        
+        A 429 is retried after the delay Telegram asks for, up to
+        MAX_RATE_LIMIT_RETRIES times, before it is raised.
+        
+        Args:
+            verb: HTTP method ("GET" or "POST")
+            url: Endpoint URL
+            payload: JSON body, if any
+            throttled: Take a token and a concurrency slot for each attempt;
+                the slot is released before waiting out a 429
+            
+        Returns:
+            Response from Telegram API
+        """
+        client = get_telegram_client()
+        content = None if payload is None else orjson.dumps(payload)
+        headers = None if payload is None else self._JSON_HEADERS
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            if throttled:
+                limits = _get_send_limits()
+                await limits.bucket.acquire()
+                async with limits.semaphore:
+                    response = await client.request(verb, url, content=content, headers=headers)
+            else:
+                response = await client.request(verb, url, content=content, headers=headers)
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                delay = _retry_after(response)
+                logger.warning(f"Telegram rate limit hit on {url.rsplit('/', 1)[-1]}, retrying in {delay}s")
+                await asyncio.sleep(delay + 0.05)
+                continue
+            if response.status_code >= 400:
+                response.raise_for_status()
+            return orjson.loads(response.content)
+    
+    def parse_webhook_update_bytes(self, raw: bytes) -> Optional[WebhookEvent]:
+        """
+        Parse a raw (undecoded) Telegram webhook body
+        
+        Args:
+            raw: Request body bytes
+            
+        Returns:
+            Same as parse_webhook_update
+        """
+        return self.parse_webhook_update(orjson.loads(raw))
     
     async def send_message(
         self,
@@ -102,8 +403,6 @@ class TelegramAdapter:
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/sendMessage"
-        
         payload = {
             "chat_id": chat_id,
             "text": text,
@@ -111,10 +410,88 @@ class TelegramAdapter:
             "disable_web_page_preview": disable_web_page_preview
         }
         
-        client = get_http_client()
-        response = await client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
+        return await self._call("POST", self._url_send_message, payload)
+    
+    def build_webhook_reply(
+        self,
+        chat_id: int,
+        text: str,
+        parse_mode: str = "HTML"
+    ) -> Dict[str, Any]:
+        """
+        Build a sendMessage call to return as the webhook HTTP response
+        
+        Telegram executes a method returned in the webhook response body, which
+        saves a separate sendMessage request. Telegram doesn't report whether
+        it succeeded, so use send_message() when the caller needs the result or
+        when the reply is produced after the webhook has returned.
+        
+        Args:
+            chat_id: Telegram chat ID
+            text: Message text
+            parse_mode: Parse mode (HTML, Markdown, or None)
+            
+        Returns:
+            Webhook response body
+        """
+        return {
+            "method": "sendMessage",
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": False
+        }
+    
+    async def send_message_many(self, payloads: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send many messages concurrently within Telegram's rate limit
+        
+        Args:
+            payloads: sendMessage parameters (chat_id, text, and optionally
+                parse_mode / disable_web_page_preview), one per message
+            
+        Returns:
+            Telegram API response or the raised exception, per payload (in order)
+        """
+        return await asyncio.gather(
+            *(self._send_throttled(payload) for payload in payloads),
+            return_exceptions=True
+        )
+    
+    async def broadcast(self, chat_ids: Iterable[int], text: str) -> List[Any]:
+        """
+        Send the same text to many chats within Telegram's rate limit
+        
+        Chats are served concurrently, while messages to any one chat (including
+        those from overlapping broadcasts) are sent one at a time, in order.
+        
+        Args:
+            chat_ids: Telegram chat IDs
+            text: Message text
+            
+        Returns:
+            Telegram API response or the raised exception, per chat (in order)
+        """
+        return await asyncio.gather(
+            *(self._send_ordered({"chat_id": chat_id, "text": text}) for chat_id in chat_ids),
+            return_exceptions=True
+        )
+    
+    async def _send_ordered(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send one message after any earlier pending send to the same chat
+        
+        The chat lock stays held while a 429 is waited out, so later messages
+        to the chat can't overtake the retried one.
+        """
+        lock = _get_send_limits().chat_locks.setdefault(payload["chat_id"], asyncio.Lock())
+        async with lock:
+            return await self._send_throttled(payload)
+    
+    async def _send_throttled(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one message through the shared rate limiter"""
+        payload = {"parse_mode": "HTML", "disable_web_page_preview": False, **payload}
+        return await self._call("POST", self._url_send_message, payload, throttled=True)
     
     async def answer_callback_query(
         self,
@@ -133,8 +510,6 @@ class TelegramAdapter:
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/answerCallbackQuery"
-        
         payload = {
             "callback_query_id": callback_query_id,
             "show_alert": show_alert
@@ -143,10 +518,34 @@ class TelegramAdapter:
         if text:
             payload["text"] = text
         
-        client = get_http_client()
-        response = await client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
+        return await self._call("POST", self._url_answer_cb, payload)
+    
+    def answer_callback_query_nowait(
+        self,
+        callback_query_id: str,
+        text: Optional[str] = None,
+        show_alert: bool = False
+    ) -> asyncio.Task:
+        """
+        Answer a callback query in the background without waiting for Telegram
+        
+        Failures are logged rather than raised. Use answer_callback_query()
+        when the caller needs to know the outcome.
+        
+        Args:
+            callback_query_id: Callback query ID
+            text: Optional text to show
+            show_alert: Whether to show as an alert
+            
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(
+            self.answer_callback_query(callback_query_id, text=text, show_alert=show_alert)
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_on_background_done)
+        return task
     
     async def set_webhook(self, webhook_url: str) -> Dict[str, Any]:
         """
@@ -158,28 +557,24 @@ class TelegramAdapter:
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/setWebhook"
-        
-        payload = {"url": webhook_url}
-        
-        client = get_http_client()
-        response = await client.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
+        result = await self._call("POST", self._url_set_webhook, {"url": webhook_url})
+        _webhook_info_cache.pop(self.bot_token, None)
+        return result
     
     async def get_webhook_info(self) -> Dict[str, Any]:
         """
-        Get current webhook information
+        Get current webhook information (cached for WEBHOOK_INFO_TTL_SECONDS)
         
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/getWebhookInfo"
+        cached = _webhook_info_cache.get(self.bot_token)
+        if cached and time.monotonic() - cached[0] < WEBHOOK_INFO_TTL_SECONDS:
+            return cached[1]
         
-        client = get_http_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.json()
+        info = await self._call("GET", self._url_get_webhook_info)
+        _webhook_info_cache[self.bot_token] = (time.monotonic(), info)
+        return info
     
     async def delete_webhook(self) -> Dict[str, Any]:
         """
@@ -188,23 +583,33 @@ class TelegramAdapter:
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/deleteWebhook"
+        result = await self._call("POST", self._url_delete_webhook)
+        _webhook_info_cache.pop(self.bot_token, None)
+        return result
+    
+    async def set_my_commands(self, commands: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Set the bot's command list shown in Telegram clients
         
-        client = get_http_client()
-        response = await client.post(url)
-        response.raise_for_status()
-        return response.json()
+        Args:
+            commands: Items with "command" and "description"
+            
+        Returns:
+            Response from Telegram API
+        """
+        return await self._call("POST", self._url_set_my_commands, {"commands": commands})
     
     async def get_me(self) -> Dict[str, Any]:
         """
-        Get bot information
+        Get bot information (cached for the process lifetime)
         
         Returns:
             Response from Telegram API
         """
-        url = f"{self.api_url}/getMe"
+        cached = _me_cache.get(self.bot_token)
+        if cached is not None:
+            return cached
         
-        client = get_http_client()
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.json()
+        me = await self._call("GET", self._url_get_me)
+        _me_cache[self.bot_token] = me
+        return me
@@ -11,8 +11,8 @@ from src.models import (
     AuditOperation,
     AIDecisionMetadata,
 )
+from src import database
 from src.database import (
-    get_collection,
     COLLECTION_TICKETS,
     COLLECTION_INTERACTIONS,
     COLLECTION_AUDIT_LOGS,
@@ -611,7 +611,7 @@ Generate a helpful response to the customer's support request."""
         """
         Save the response as an interaction
         """
-        interactions_collection = get_collection(COLLECTION_INTERACTIONS)
+        interactions_collection = database.get_collection(COLLECTION_INTERACTIONS)
         
         # Build AI metadata for transparency
         decision_type = resolution.get("decision_type", "resolution")
@@ -639,7 +639,7 @@ Generate a helpful response to the customer's support request."""
             await interactions_collection.insert_one(interaction_data)
         
         # Create audit log
-        audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+        audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
         
         audit_log = AuditLogCreate(
             ticket_id=ticket_id,
@@ -10,8 +10,8 @@ from src.models import (
     AuditLogCreate,
     AuditOperation,
 )
+from src import database
 from src.database import (
-    get_collection,
     COLLECTION_TICKETS,
     COLLECTION_ROUTING_DECISIONS,
     COLLECTION_AUDIT_LOGS,
@@ -102,7 +102,7 @@ class RouterAgent(BaseAgent):
     
     async def _get_company_config(self, company_id: str) -> Optional[CompanyConfig]:
         """Fetch company configuration from database"""
-        collection = get_collection(COLLECTION_COMPANY_CONFIGS)
+        collection = database.get_collection(COLLECTION_COMPANY_CONFIGS)
         data = await collection.find_one({"company_id": company_id})
         if data:
             return CompanyConfig(**data)
@@ -293,7 +293,7 @@ Which team should handle this ticket?"""
             routing: Routing decision data
             session: Optional MongoDB session
         """
-        routing_collection = get_collection(COLLECTION_ROUTING_DECISIONS)
+        routing_collection = database.get_collection(COLLECTION_ROUTING_DECISIONS)
         
         routing_decision = RoutingDecisionCreate(
             ticket_id=ticket_id,
@@ -312,7 +312,7 @@ Which team should handle this ticket?"""
             await routing_collection.insert_one(routing_data)
         
         # Create audit log
-        audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+        audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
         
         audit_log = AuditLogCreate(
             ticket_id=ticket_id,
@@ -342,7 +342,7 @@ Which team should handle this ticket?"""
             ticket_id: ID of the ticket
             session: Optional MongoDB session
         """
-        tickets_collection = get_collection(COLLECTION_TICKETS)
+        tickets_collection = database.get_collection(COLLECTION_TICKETS)
         
         update_data = {
             "current_phase": TicketPhase.RESOLUTION,
@@ -13,8 +13,8 @@ from src.models import (
     AuditOperation,
     AIDecisionMetadata,
 )
+from src import database
 from src.database import (
-    get_collection,
     COLLECTION_TICKETS,
     COLLECTION_INTERACTIONS,
     COLLECTION_AUDIT_LOGS,
@@ -534,7 +534,7 @@ Analyze this ticket and provide the triage assessment."""
             session: Optional MongoDB session
         """
         # Update ticket with priority, category, and tags
-        tickets_collection = get_collection(COLLECTION_TICKETS)
+        tickets_collection = database.get_collection(COLLECTION_TICKETS)
 
         update_data = {
             "priority": analysis["priority"],
@@ -557,7 +557,7 @@ Analyze this ticket and provide the triage assessment."""
             )
         
         # Create interaction record
-        interactions_collection = get_collection(COLLECTION_INTERACTIONS)
+        interactions_collection = database.get_collection(COLLECTION_INTERACTIONS)
         
         # Build AI metadata for transparency
         ai_metadata = AIDecisionMetadata(
@@ -584,7 +584,7 @@ Analyze this ticket and provide the triage assessment."""
             await interactions_collection.insert_one(interaction_data)
         
         # Create audit log
-        audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+        audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
         
         audit_log = AuditLogCreate(
             ticket_id=ticket_id,
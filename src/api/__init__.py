@@ -1,11 +1,25 @@
 """
 API endpoints
+
+Routers are resolved lazily so that importing one route module (e.g.
+``src.api.ingest_routes``) does not import every other router and its
+dependencies.
 """
-from .routes import router
-from .ingest_routes import router as ingest_router
-from .telegram_routes import router as telegram_router
-from .company_routes import router as company_router
-from .human_routes import router as human_router
+import importlib
+
+_ROUTERS = {
+    "router": ".routes",
+    "ingest_router": ".ingest_routes",
+    "telegram_router": ".telegram_routes",
+    "company_router": ".company_routes",
+    "human_router": ".human_routes",
+}
 
-__all__ = ["router", "ingest_router", "telegram_router", "company_router", "human_router"]
 
+def __getattr__(name):
+    if name in _ROUTERS:
+        return importlib.import_module(_ROUTERS[name], __name__).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["router", "ingest_router", "telegram_router", "company_router", "human_router"]
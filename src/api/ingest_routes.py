@@ -13,8 +13,8 @@ from src.models import (
     TicketChannel,
     TicketStatus,
 )
+from src import database
 from src.database import (
-    get_collection,
     COLLECTION_TICKETS,
     COLLECTION_AUDIT_LOGS,
     COLLECTION_INTERACTIONS,
@@ -56,7 +56,7 @@ limiter = Limiter(key_func=get_remote_address)
 async def _get_company_config(company_id: str) -> CompanyConfig | None:
     if not company_id:
         return None
-    collection = get_collection(COLLECTION_COMPANY_CONFIGS)
+    collection = database.get_collection(COLLECTION_COMPANY_CONFIGS)
     config = await collection.find_one({"company_id": company_id})
     if not config:
         return None
@@ -65,7 +65,7 @@ async def _get_company_config(company_id: str) -> CompanyConfig | None:
 
 
 async def _get_last_interactions(ticket_id: str, limit: int = 3) -> list[Dict[str, Any]]:
-    collection = get_collection(COLLECTION_INTERACTIONS)
+    collection = database.get_collection(COLLECTION_INTERACTIONS)
     cursor = collection.find({"ticket_id": ticket_id}).sort("created_at", -1).limit(limit)
     interactions = []
     async for interaction in cursor:
@@ -195,7 +195,7 @@ async def process_ingest_message(
         logger.info(f"PII detected in message for company {company_id}: types={pii_types}")
 
     pipeline = AgentPipeline()
-    tickets_collection = get_collection(COLLECTION_TICKETS)
+    tickets_collection = database.get_collection(COLLECTION_TICKETS)
     now = datetime.utcnow()
     company_config = await _get_company_config(company_id)
     lifecycle_cfg = company_config.lifecycle_config if company_config else TicketLifecycleConfig()
@@ -292,7 +292,7 @@ async def process_ingest_message(
         await update_ticket_interactions_count(ticket_id)
 
         # Create audit log for message ingestion (using sanitized values)
-        audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+        audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
         await audit_collection.insert_one({
             "ticket_id": ticket_id,
             "agent_name": "system",
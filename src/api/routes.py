@@ -16,8 +16,8 @@ from src.models import (
     TicketChannel,
     TicketCategory,
 )
+from src import database
 from src.database import (
-    get_collection,
     COLLECTION_TICKETS,
     COLLECTION_AUDIT_LOGS,
     COLLECTION_AGENT_STATES,
@@ -96,7 +96,7 @@ async def create_ticket(
             detail=f"Invalid input: {str(e)}"
         )
 
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
 
     # Check if ticket_id already exists
     existing = await collection.find_one({"ticket_id": ticket_data.ticket_id})
@@ -117,7 +117,7 @@ async def create_ticket(
     ticket_dict["_id"] = str(result.inserted_id)
     
     # Create audit log
-    audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+    audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
     await audit_collection.insert_one({
         "ticket_id": ticket_data.ticket_id,
         "agent_name": "system",
@@ -155,7 +155,7 @@ async def run_pipeline(
         Pipeline execution results
     """
     # Verify ticket belongs to company
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
     ticket = await collection.find_one({"ticket_id": ticket_id})
     if not ticket:
         raise HTTPException(
@@ -216,7 +216,7 @@ async def get_ticket(
     Returns:
         Ticket data
     """
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
     ticket = await collection.find_one({"ticket_id": ticket_id})
 
     if not ticket:
@@ -260,7 +260,7 @@ async def get_ticket_audit(
         Audit log entries
     """
     # Verify ticket belongs to company
-    tickets_collection = get_collection(COLLECTION_TICKETS)
+    tickets_collection = database.get_collection(COLLECTION_TICKETS)
     ticket = await tickets_collection.find_one({"ticket_id": ticket_id})
     if not ticket or ticket.get("company_id") != api_key["company_id"]:
         raise HTTPException(
@@ -268,7 +268,7 @@ async def get_ticket_audit(
             detail=f"Ticket {ticket_id} not found"
         )
 
-    audit_collection = get_collection(COLLECTION_AUDIT_LOGS)
+    audit_collection = database.get_collection(COLLECTION_AUDIT_LOGS)
     
     cursor = audit_collection.find({"ticket_id": ticket_id}).sort("timestamp", 1)
     
@@ -305,7 +305,7 @@ async def get_ticket_interactions(
         List of interactions
     """
     # Verify ticket belongs to company
-    tickets_collection = get_collection(COLLECTION_TICKETS)
+    tickets_collection = database.get_collection(COLLECTION_TICKETS)
     ticket = await tickets_collection.find_one({"ticket_id": ticket_id})
     if not ticket or ticket.get("company_id") != api_key["company_id"]:
         raise HTTPException(
@@ -313,7 +313,7 @@ async def get_ticket_interactions(
             detail=f"Ticket {ticket_id} not found"
         )
 
-    interactions_collection = get_collection(COLLECTION_INTERACTIONS)
+    interactions_collection = database.get_collection(COLLECTION_INTERACTIONS)
     
     cursor = interactions_collection.find({"ticket_id": ticket_id}).sort("created_at", 1)
     
@@ -350,7 +350,7 @@ async def get_ticket_agent_states(
         List of agent states
     """
     # Verify ticket belongs to company
-    tickets_collection = get_collection(COLLECTION_TICKETS)
+    tickets_collection = database.get_collection(COLLECTION_TICKETS)
     ticket = await tickets_collection.find_one({"ticket_id": ticket_id})
     if not ticket or ticket.get("company_id") != api_key["company_id"]:
         raise HTTPException(
@@ -358,7 +358,7 @@ async def get_ticket_agent_states(
             detail=f"Ticket {ticket_id} not found"
         )
 
-    agent_states_collection = get_collection(COLLECTION_AGENT_STATES)
+    agent_states_collection = database.get_collection(COLLECTION_AGENT_STATES)
     
     cursor = agent_states_collection.find({"ticket_id": ticket_id})
     
@@ -402,7 +402,7 @@ async def list_tickets(
     Returns:
         List of tickets
     """
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
 
     # Build filter with company isolation
     filter_dict = {"company_id": api_key["company_id"]}
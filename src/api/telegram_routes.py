@@ -6,6 +6,7 @@ from typing import Dict, Any
 import hmac
 import json
 import logging
+import orjson
 import re
 from pathlib import Path
 from urllib.parse import urlparse
@@ -122,13 +123,13 @@ async def telegram_webhook(request: Request) -> Dict[str, Any]:
     2. Parses the Telegram update payload
     3. Converts it to the standard ingest format
     4. Calls the /ingest-message endpoint
-    5. Sends the response back to the user via Telegram
+    5. Returns the reply to Telegram as a sendMessage call in the response body
 
     Args:
         request: FastAPI request with Telegram webhook payload
 
     Returns:
-        Success response
+        sendMessage call with the reply, or a status response when there is none
 
     Raises:
         HTTPException 403: If webhook signature verification fails
@@ -142,7 +143,7 @@ async def telegram_webhook(request: Request) -> Dict[str, Any]:
 
     try:
         # Get Telegram update from request body
-        update = await request.json()
+        update = orjson.loads(await request.body())
 
         # Log and persist with PII redaction
         redacted_update = _redact_pii_from_webhook(update)
@@ -158,21 +159,27 @@ async def telegram_webhook(request: Request) -> Dict[str, Any]:
         # Initialize Telegram adapter
         adapter = TelegramAdapter()
         
+        # Telegram redelivers updates on timeouts/errors; skip ones already handled
+        update_id = update.get("update_id")
+        if adapter.is_duplicate(update_id):
+            logger.info(f"Skipping already processed update: {update_id}")
+            return {"status": "ok", "message": "Duplicate update ignored"}
+        
         # Parse the webhook update
         parsed = adapter.parse_webhook_update(update)
         logger.info(f"Parsed webhook update: {parsed}")
         
         if not parsed:
-            logger.warning(f"Received update without message: {update.get('update_id')}")
+            logger.warning(f"Received update without message: {update_id}")
             return {"status": "ok", "message": "No message to process"}
 
         # SANITIZE INPUTS from Telegram
         try:
-            text = sanitize_text(parsed["text"], max_length=4000)
-            external_user_id = sanitize_identifier(parsed["external_user_id"])
+            text = sanitize_text(parsed.text, max_length=4000)
+            external_user_id = sanitize_identifier(parsed.external_user_id)
 
             # Sanitize company_id if present
-            company_id = parsed["metadata"].get("company_id")
+            company_id = parsed.metadata.get("company_id")
             if company_id:
                 company_id = sanitize_company_id(company_id)
         except ValueError as e:
@@ -182,16 +189,20 @@ async def telegram_webhook(request: Request) -> Dict[str, Any]:
                 detail=f"Invalid input: {str(e)}"
             )
 
+        # Acknowledge button presses right away so the client stops spinning
+        callback_query_id = parsed.metadata.get("callback_query_id")
+        if callback_query_id:
+            adapter.answer_callback_query_nowait(callback_query_id)
+
         # Extract chat_id for sending reply
-        chat_id = parsed["metadata"].get("chat_id")
-        callback_query_id = parsed["metadata"].get("callback_query_id")
+        chat_id = parsed.metadata.get("chat_id")
 
         # Create ingest message request (using sanitized values)
         ingest_request = IngestMessageRequest(
             channel=IngestChannel.TELEGRAM,
             external_user_id=external_user_id,
             text=text,
-            metadata=parsed["metadata"],
+            metadata=parsed.metadata,
             company_id=company_id
         )
 
@@ -200,24 +211,21 @@ async def telegram_webhook(request: Request) -> Dict[str, Any]:
         response = await process_ingest_message(ingest_request)
         logger.info(f"Received response from process_ingest_message: {response}")
         
-        # Send the reply back to Telegram
-        if chat_id and response.reply_text:
-            await adapter.send_message(
-                chat_id=chat_id,
-                text=response.reply_text
-            )
-        
-        # Answer callback query if this was a button press
-        if callback_query_id:
-            await adapter.answer_callback_query(
-                callback_query_id=callback_query_id
-            )
+        # Only now is the update handled; a failure above lets the redelivery through
+        adapter.mark_processed(update_id)
         
         logger.info(
-            f"Processed Telegram message from {parsed['external_user_id']}, "
+            f"Processed Telegram message from {parsed.external_user_id}, "
             f"ticket_id: {response.ticket_id}, escalated: {response.escalated}"
         )
         
+        # Reply in the webhook response itself instead of a separate sendMessage call
+        if chat_id and response.reply_text:
+            return adapter.build_webhook_reply(
+                chat_id=chat_id,
+                text=response.reply_text
+            )
+        
         return {
             "status": "ok",
             "message": "Message processed successfully",
@@ -197,10 +197,10 @@ class TelegramBot:
             
             # Se for uma mensagem de texto simples ou comando
             if parsed:
-                chat_id = parsed["metadata"].get("chat_id")
-                external_user_id = parsed["external_user_id"]
-                text = parsed["text"]
-                user_info = parsed["metadata"]
+                chat_id = parsed.metadata.get("chat_id")
+                external_user_id = parsed.external_user_id
+                text = parsed.text
+                user_info = parsed.metadata
                 
                 # Obter sessão
                 session = await self.get_or_create_session(chat_id, user_info)
@@ -30,6 +30,7 @@ class Settings(BaseSettings):
     telegram_bot_token: Optional[str] = None
     telegram_polling_timeout: int = 30
     telegram_webhook_secret: Optional[str] = None  # Required in production for webhook verification
+    telegram_api_base: str = "https://api.telegram.org"  # Point at a local Bot API server if self-hosted
 
     # JWT Configuration (for dashboard authentication)
     jwt_secret_key: str = "CHANGE_THIS_IN_PRODUCTION"  # Must be set in .env
@@ -83,6 +84,13 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    # Feature Flags (optional routers are only imported when enabled)
+    enable_ingest_api: bool = True        # /api/ingest-message
+    enable_telegram_api: bool = True      # /telegram/webhook
+    enable_company_api: bool = True       # /api/companies
+    enable_human_api: bool = True         # /api/human (escalated ticket handling)
+    enable_api_key_api: bool = True       # /api/keys
+
     @field_validator("cors_allowed_origins", mode="before")
     @classmethod
     def parse_cors_allowed_origins(cls, v: Any) -> Any:
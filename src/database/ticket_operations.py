@@ -4,7 +4,8 @@ Database operations for ticket management with channel-agnostic support
 from typing import Dict, Any, Optional
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorClientSession
-from src.database import get_collection, COLLECTION_TICKETS, COLLECTION_INTERACTIONS
+from src import database
+from src.database import COLLECTION_TICKETS, COLLECTION_INTERACTIONS
 from src.models import TicketChannel, TicketStatus, TicketPhase, TicketPriority
 
 
@@ -29,7 +30,7 @@ async def find_or_create_ticket(
     Returns:
         Tuple of (ticket_dict, is_new_ticket)
     """
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
     
     # Try to find an existing active ticket for this user and channel.
     active_statuses = [TicketStatus.OPEN, TicketStatus.IN_PROGRESS]
@@ -117,7 +118,7 @@ async def add_interaction(
     Returns:
         Created interaction document
     """
-    collection = get_collection(COLLECTION_INTERACTIONS)
+    collection = database.get_collection(COLLECTION_INTERACTIONS)
     
     interaction_dict = {
         "ticket_id": ticket_id,
@@ -147,7 +148,7 @@ async def update_ticket_interactions_count(
         ticket_id: ID of the ticket
         session: Optional MongoDB session for transactions
     """
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
     
     await collection.update_one(
         {"ticket_id": ticket_id},
@@ -172,7 +173,7 @@ async def update_ticket_status(
         status: New status
         session: Optional MongoDB session for transactions
     """
-    collection = get_collection(COLLECTION_TICKETS)
+    collection = database.get_collection(COLLECTION_TICKETS)
     
     await collection.update_one(
         {"ticket_id": ticket_id},
@@ -5,6 +5,7 @@ Provides production-safe CORS origin filtering that automatically
 removes localhost origins in production environment.
 """
 import logging
+from functools import lru_cache
 from typing import List
 
 from src.config import settings
@@ -12,10 +13,14 @@ from src.config import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_cors_origins() -> List[str]:
     """
     Get CORS allowed origins, filtering localhost in production.
 
+    Settings are fixed for the lifetime of the process, so the result is
+    computed once and cached. Callers must not mutate the returned list.
+
     In production environment, this function:
     - Filters out any localhost or 127.0.0.1 origins
     - Raises ValueError if no valid origins remain
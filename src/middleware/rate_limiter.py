@@ -7,6 +7,7 @@ proxies or by rotating IP addresses.
 """
 import hashlib
 import logging
+from functools import lru_cache
 from typing import Optional
 from fastapi import Request
 from slowapi.util import get_remote_address
@@ -27,6 +28,17 @@ RATE_LIMITS = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _hash_fingerprint(ip: str, user_agent: str, api_key: str) -> str:
+    """
+    Hash a client fingerprint, caching recent results.
+
+    Repeat requests from the same client reuse the cached digest instead
+    of re-encoding and hashing the fingerprint.
+    """
+    return hashlib.md5(f"{ip}:{user_agent}:{api_key}".encode()).hexdigest()
+
+
 def get_rate_limit_key(request: Request) -> str:
     """
     Generate a rate limit key based on client fingerprint.
@@ -54,13 +66,11 @@ def get_rate_limit_key(request: Request) -> str:
     # Get API Key prefix (first 10 chars for differentiation without exposing full key)
     api_key = request.headers.get("X-API-Key", "")[:10]
 
-    # Create fingerprint string
-    fingerprint = f"{ip}:{user_agent}:{api_key}"
-
     # Hash the fingerprint for consistent key length
-    hashed_key = hashlib.md5(fingerprint.encode()).hexdigest()
+    hashed_key = _hash_fingerprint(ip, user_agent, api_key)
 
-    logger.debug(f"Rate limit key generated for IP {ip}: {hashed_key[:8]}...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Rate limit key generated for IP {ip}: {hashed_key[:8]}...")
 
     return hashed_key
 
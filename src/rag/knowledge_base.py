@@ -1,6 +1,7 @@
 """
 Knowledge Base Module using ChromaDB and OpenAI Embeddings
 """
+import asyncio
 import os
 import chromadb
 from chromadb.utils import embedding_functions
@@ -81,8 +82,9 @@ class KnowledgeBase:
             } for i in range(len(chunks))
         ]
         
-        # Add to Chroma
-        collection.add(
+        # Add to Chroma (embedding is a blocking HTTP call, keep it off the event loop)
+        await asyncio.to_thread(
+            collection.add,
             documents=chunks,
             metadatas=metadatas,
             ids=ids
@@ -19,6 +19,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 # Default timeout configuration (in seconds)
 DEFAULT_TIMEOUT = httpx.Timeout(
@@ -36,6 +43,14 @@ LLM_TIMEOUT = httpx.Timeout(
     pool=5.0
 )
 
+# Telegram Bot API calls are small and should answer quickly
+TELEGRAM_TIMEOUT = httpx.Timeout(
+    connect=5.0,
+    read=10.0,
+    write=10.0,
+    pool=5.0
+)
+
 # Short timeout for health checks
 HEALTH_CHECK_TIMEOUT = httpx.Timeout(
     connect=2.0,
@@ -133,6 +148,7 @@ class HTTPClient:
 # Singleton instances for different use cases
 _default_client: Optional[HTTPClient] = None
 _llm_client: Optional[HTTPClient] = None
+_telegram_client: Optional[HTTPClient] = None
 
 
 def get_http_client(timeout: Optional[httpx.Timeout] = None) -> HTTPClient:
@@ -176,6 +192,34 @@ def get_llm_client() -> HTTPClient:
     return _llm_client
 
 
+def get_telegram_client() -> HTTPClient:
+    """
+    Get or create the Telegram Bot API HTTP client singleton.
+    
+    All calls go to api.telegram.org, so connections are kept alive
+    longer than the default client to reuse the TLS session between
+    updates. When h2 is installed, concurrent sends are multiplexed over
+    a single HTTP/2 connection.
+    
+    Returns:
+        HTTPClient instance configured for the Telegram Bot API
+    """
+    global _telegram_client
+    
+    if _telegram_client is None:
+        _telegram_client = HTTPClient(
+            timeout=TELEGRAM_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=75.0
+            ),
+            http2=HTTP2_AVAILABLE
+        )
+    
+    return _telegram_client
+
+
 @asynccontextmanager
 async def http_client(timeout: Optional[httpx.Timeout] = None):
     """
@@ -197,7 +241,7 @@ async def cleanup_http_clients():
     Cleanup all singleton HTTP clients.
     Call this during application shutdown.
     """
-    global _default_client, _llm_client
+    global _default_client, _llm_client, _telegram_client
     
     if _default_client:
         await _default_client.close()
@@ -208,6 +252,11 @@ async def cleanup_http_clients():
         await _llm_client.close()
         _llm_client = None
         logger.info("LLM HTTP client closed")
+    
+    if _telegram_client:
+        await _telegram_client.close()
+        _telegram_client = None
+        logger.info("Telegram HTTP client closed")
 
 
 # Convenience functions for common patterns
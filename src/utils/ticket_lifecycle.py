@@ -129,7 +129,8 @@ async def process_due_lifecycle_events(limit: int = 100) -> None:
     lifecycle_collection = get_collection(COLLECTION_TICKET_LIFECYCLE_EVENTS)
     tickets_collection = get_collection(COLLECTION_TICKETS)
     company_collection = get_collection(COLLECTION_COMPANY_CONFIGS)
-    adapter = TelegramAdapter()
+    # Built on first use so deployments without Telegram still process events
+    adapter = None
 
     while True:
         now = datetime.utcnow()
@@ -193,6 +194,8 @@ async def process_due_lifecycle_events(limit: int = 100) -> None:
 
         if message and chat_id:
             try:
+                if adapter is None:
+                    adapter = TelegramAdapter()
                 await adapter.send_message(chat_id, message)
             except Exception as exc:
                 logger.error("Failed to send lifecycle message for ticket %s: %s", ticket["ticket_id"], exc)
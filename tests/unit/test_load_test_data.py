@@ -0,0 +1,114 @@
+from datetime import datetime
+
+import orjson
+import pytest
+from pymongo.errors import BulkWriteError
+
+from scripts import load_test_data
+from scripts.load_test_data import _insert_batches, _load_batch
+
+
+class FakeCursor:
+    def __init__(self, items):
+        self.items = list(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.items:
+            raise StopAsyncIteration
+        return self.items.pop(0)
+
+
+class FakeBulkCollection:
+    """insert_many fails (unordered) for documents whose ticket_id is in fail_ids"""
+
+    def __init__(self, fail_ids=(), existing_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.existing_ids = list(existing_ids)
+        self.inserted = []
+        self.indexes = []
+
+    async def create_index(self, keys, **kwargs):
+        self.indexes.append((keys, kwargs))
+
+    def find(self, *args, **kwargs):
+        return FakeCursor({"ticket_id": ticket_id} for ticket_id in self.existing_ids)
+
+    async def insert_many(self, docs, ordered=True):
+        write_errors = []
+        for index, doc in enumerate(docs):
+            if doc["ticket_id"] in self.fail_ids:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+            else:
+                self.inserted.append(doc)
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+
+def _ticket(ticket_id):
+    return {
+        "ticket_id": ticket_id,
+        "customer_id": "cust-1",
+        "channel": "telegram",
+        "subject": "Subject",
+        "description": f"Description {ticket_id}",
+        "priority": "P2",
+        "status": "open",
+        "current_phase": "triage",
+        "interactions_count": 0,
+    }
+
+
+@pytest.mark.unit
+async def test_insert_batches_maps_write_errors_to_doc_indexes(monkeypatch):
+    monkeypatch.setattr(load_test_data, "INSERT_BATCH_SIZE", 2)
+    docs = [{"ticket_id": f"T{i}"} for i in range(5)]
+    collection = FakeBulkCollection(fail_ids={"T0", "T3"})
+
+    failed = await _insert_batches(collection, docs)
+
+    # T3 is index 1 of the second batch; it must map back to index 3 of docs
+    assert failed == {0, 3}
+    assert [d["ticket_id"] for d in collection.inserted] == ["T1", "T2", "T4"]
+
+
+@pytest.mark.unit
+async def test_load_batch_skips_interactions_of_failed_tickets(monkeypatch):
+    monkeypatch.setattr(load_test_data, "INSERT_BATCH_SIZE", 2)
+    tickets = FakeBulkCollection(fail_ids={"T2", "T3"}, existing_ids=["T1"])
+    interactions = FakeBulkCollection()
+    batch = [_ticket(f"T{i}") for i in range(5)]
+
+    created = await _load_batch(tickets, interactions, batch, datetime(2024, 1, 1))
+
+    assert created == 2
+    assert [d["ticket_id"] for d in tickets.inserted] == ["T0", "T4"]
+    assert [d["ticket_id"] for d in interactions.inserted] == ["T0", "T4"]
+
+
+@pytest.mark.unit
+async def test_load_tickets_end_to_end(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(load_test_data, "INSERT_BATCH_SIZE", 2)
+    tickets = FakeBulkCollection(fail_ids={"T3"}, existing_ids=["T1"])
+    interactions = FakeBulkCollection()
+    collections = {
+        load_test_data.COLLECTION_TICKETS: tickets,
+        load_test_data.COLLECTION_INTERACTIONS: interactions,
+    }
+    # get_collection is synchronous; a coroutine here would break the script
+    monkeypatch.setattr(load_test_data, "get_collection", collections.__getitem__)
+
+    (tmp_path / "test_data").mkdir()
+    (tmp_path / "test_data" / "tickets.json").write_bytes(
+        orjson.dumps([_ticket(f"T{i}") for i in range(5)])
+    )
+    monkeypatch.chdir(tmp_path)
+
+    await load_test_data.load_tickets()
+
+    assert tickets.indexes == [([("ticket_id", 1)], {"unique": True})]
+    assert sorted(d["ticket_id"] for d in tickets.inserted) == ["T0", "T2", "T4"]
+    assert sorted(d["ticket_id"] for d in interactions.inserted) == ["T0", "T2", "T4"]
+    assert "Created 3 ticket(s)" in capsys.readouterr().out
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -9,9 +11,11 @@ import pytest
 
 from src.api.routes import router as tickets_router
 from src.api.ingest_routes import router as ingest_router
+from src.api.telegram_routes import router as telegram_router, limiter as telegram_limiter
+from src.config import settings
 from src.middleware.auth import verify_api_key
 from src.database import COLLECTION_TICKETS, COLLECTION_INTERACTIONS, COLLECTION_AUDIT_LOGS
-from src.models import TicketStatus
+from src.models import TicketStatus, IngestMessageResponse
 
 
 def build_app():
@@ -171,3 +175,92 @@ def test_ingest_message_success_non_escalated(fake_db, monkeypatch):
     assert data["ticket_id"] == "T-500"
     assert data["reply_text"] == "Resposta"
     assert interactions
+
+
+TEST_BOT_TOKEN = "123456789:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw"
+
+TELEGRAM_UPDATE = {
+    "update_id": 1001,
+    "message": {
+        "message_id": 7,
+        "text": "Oi",
+        "from": {"id": 42, "first_name": "Ana"},
+        "chat": {"id": 42, "type": "private"},
+    },
+}
+
+
+def build_telegram_app():
+    app = FastAPI()
+    app.state.limiter = telegram_limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.include_router(telegram_router)
+    return app
+
+
+@pytest.fixture
+def telegram_webhook_env(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "environment", "development")
+    monkeypatch.setattr(settings, "telegram_bot_token", TEST_BOT_TOKEN)
+    monkeypatch.setattr(settings, "telegram_webhook_secret", None)
+    monkeypatch.setattr("src.api.telegram_routes._WEBHOOK_DUMP_PATH", tmp_path / "telegram_webhook.jsonl")
+    monkeypatch.setattr("src.adapters.telegram_adapter._processed_updates", OrderedDict())
+
+
+@pytest.mark.unit
+def test_telegram_webhook_redelivery_after_failure_is_processed(telegram_webhook_env, monkeypatch):
+    client = TestClient(build_telegram_app())
+    calls = []
+
+    async def fake_process_ingest_message(ingest_request):
+        calls.append(ingest_request.text)
+        if len(calls) == 1:
+            raise RuntimeError("pipeline unavailable")
+        return IngestMessageResponse(success=True, ticket_id="T-1", reply_text="Olá!", message="ok")
+
+    monkeypatch.setattr("src.api.telegram_routes.process_ingest_message", fake_process_ingest_message)
+
+    first = client.post("/telegram/webhook", json=TELEGRAM_UPDATE)
+    assert first.status_code == 500
+
+    # Telegram redelivers the same update_id; it must be processed, not dropped
+    second = client.post("/telegram/webhook", json=TELEGRAM_UPDATE)
+    assert second.status_code == 200
+    assert second.json() == {
+        "method": "sendMessage",
+        "chat_id": 42,
+        "text": "Olá!",
+        "parse_mode": "HTML",
+        "disable_web_page_preview": False,
+    }
+    assert calls == ["Oi", "Oi"]
+
+    # Once processed, further redeliveries are skipped
+    third = client.post("/telegram/webhook", json=TELEGRAM_UPDATE)
+    assert third.status_code == 200
+    assert third.json()["message"] == "Duplicate update ignored"
+    assert calls == ["Oi", "Oi"]
+
+
+@pytest.mark.unit
+def test_telegram_webhook_redelivery_after_invalid_input_is_processed(telegram_webhook_env, monkeypatch):
+    client = TestClient(build_telegram_app())
+    sanitize_calls = []
+
+    def flaky_sanitize_text(text, max_length):
+        sanitize_calls.append(text)
+        if len(sanitize_calls) == 1:
+            raise ValueError("bad input")
+        return text
+
+    async def fake_process_ingest_message(ingest_request):
+        return IngestMessageResponse(success=True, ticket_id="T-2", message="ok")
+
+    monkeypatch.setattr("src.api.telegram_routes.sanitize_text", flaky_sanitize_text)
+    monkeypatch.setattr("src.api.telegram_routes.process_ingest_message", fake_process_ingest_message)
+
+    assert client.post("/telegram/webhook", json=TELEGRAM_UPDATE).status_code == 400
+
+    second = client.post("/telegram/webhook", json=TELEGRAM_UPDATE)
+    assert second.status_code == 200
+    assert second.json()["ticket_id"] == "T-2"
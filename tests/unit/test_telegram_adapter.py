@@ -0,0 +1,414 @@
+import asyncio
+import gc
+import inspect
+import time
+from collections import OrderedDict
+
+import httpx
+import orjson
+import pytest
+
+from src.adapters import telegram_adapter
+from src.config import settings
+from src.adapters.telegram_adapter import TelegramAdapter, WebhookEvent
+
+
+TEST_BOT_TOKEN = "123456789:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw"
+
+
+def text_update(update_id=1, text="Oi"):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": 10,
+            "text": text,
+            "from": {"id": 42, "username": "ana", "first_name": "Ana", "language_code": "pt-br"},
+            "chat": {"id": 42, "type": "private"},
+        },
+    }
+
+
+class FakeTelegramClient:
+    """Stands in for get_telegram_client(); answers each request via `handler`."""
+
+    def __init__(self):
+        self.requests = []
+        self.handler = lambda method, body: (200, {"ok": True, "result": body})
+
+    async def request(self, verb, url, content=None, headers=None):
+        method = url.rsplit("/", 1)[-1]
+        body = orjson.loads(content) if content is not None else None
+        self.requests.append((method, body))
+        # Yield like a real request would, so concurrent sends interleave
+        await asyncio.sleep(0)
+        result = self.handler(method, body)
+        if inspect.isawaitable(result):
+            result = await result
+        status_code, data, *rest = result
+        return httpx.Response(
+            status_code,
+            json=data,
+            headers=rest[0] if rest else None,
+            request=httpx.Request(verb, url),
+        )
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.setattr(telegram_adapter, "_processed_updates", OrderedDict())
+    monkeypatch.setattr(telegram_adapter, "_send_limits", None)
+    return TelegramAdapter(bot_token=TEST_BOT_TOKEN)
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Record non-zero asyncio.sleep delays without actually waiting."""
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        if delay:
+            sleeps.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(telegram_adapter.asyncio, "sleep", fake_sleep)
+    return sleeps
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = FakeTelegramClient()
+    monkeypatch.setattr(telegram_adapter, "get_telegram_client", lambda: client)
+    return client
+
+
+@pytest.mark.unit
+def test_parse_webhook_update_is_repeatable(adapter):
+    update = text_update(update_id=5)
+
+    first = adapter.parse_webhook_update(update)
+    second = adapter.parse_webhook_update(update)
+
+    assert first is not None
+    assert first == second
+
+
+@pytest.mark.unit
+def test_update_is_duplicate_only_after_mark_processed(adapter):
+    assert adapter.is_duplicate(5) is False
+
+    adapter.mark_processed(5)
+
+    assert adapter.is_duplicate(5) is True
+    assert adapter.is_duplicate(6) is False
+
+
+@pytest.mark.unit
+def test_update_without_id_is_never_duplicate(adapter):
+    adapter.mark_processed(None)
+
+    assert adapter.is_duplicate(None) is False
+
+
+@pytest.mark.unit
+def test_processed_updates_are_capped(adapter, monkeypatch):
+    monkeypatch.setattr(telegram_adapter, "PROCESSED_UPDATES_MAX", 2)
+
+    for update_id in (1, 2, 3):
+        adapter.mark_processed(update_id)
+
+    assert adapter.is_duplicate(1) is False
+    assert adapter.is_duplicate(2) is True
+    assert adapter.is_duplicate(3) is True
+
+
+@pytest.mark.unit
+def test_adapter_requires_bot_token(monkeypatch):
+    monkeypatch.setattr(settings, "telegram_bot_token", None)
+
+    with pytest.raises(RuntimeError, match="not configured"):
+        TelegramAdapter()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token", ["your_telegram_bot_token_here", "123456", "abc:def", "123:has space"])
+def test_adapter_rejects_malformed_bot_token(token):
+    with pytest.raises(RuntimeError, match="malformed"):
+        TelegramAdapter(bot_token=token)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token", [TEST_BOT_TOKEN, "1:test-token", "42:a_b"])
+def test_adapter_accepts_well_formed_bot_token(token):
+    assert TelegramAdapter(bot_token=token).bot_token == token
+
+
+@pytest.mark.unit
+def test_adapter_uses_configured_api_base(monkeypatch):
+    monkeypatch.setattr(settings, "telegram_api_base", "http://localhost:8081/")
+
+    adapter = TelegramAdapter(bot_token=TEST_BOT_TOKEN)
+
+    assert adapter.api_url == f"http://localhost:8081/bot{TEST_BOT_TOKEN}"
+
+
+@pytest.mark.unit
+async def test_send_message_many_returns_results_and_errors_in_order(adapter, fake_client):
+    def handler(method, body):
+        if body["chat_id"] == 2:
+            return 400, {"ok": False, "description": "Bad Request: chat not found"}
+        return 200, {"ok": True, "result": body}
+
+    fake_client.handler = handler
+
+    results = await adapter.send_message_many([
+        {"chat_id": 1, "text": "a"},
+        {"chat_id": 2, "text": "b"},
+        {"chat_id": 3, "text": "c", "parse_mode": "Markdown"},
+    ])
+
+    assert results[0]["result"] == {"chat_id": 1, "text": "a", "parse_mode": "HTML", "disable_web_page_preview": False}
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    assert results[1].response.status_code == 400
+    assert results[2]["result"]["parse_mode"] == "Markdown"
+
+
+@pytest.mark.unit
+async def test_send_message_many_paces_sends_with_token_bucket(adapter, fake_client, monkeypatch):
+    monkeypatch.setattr(telegram_adapter, "SEND_RATE_PER_SECOND", 10)
+
+    start = time.monotonic()
+    results = await adapter.send_message_many([{"chat_id": i, "text": "x"} for i in range(12)])
+    elapsed = time.monotonic() - start
+
+    # 10 tokens are available at once; the last 2 wait for refills at 10/s
+    assert elapsed >= 0.15
+    assert len(fake_client.requests) == 12
+    assert all(result["ok"] for result in results)
+
+
+@pytest.mark.unit
+def test_send_limits_follow_the_running_loop(adapter, fake_client, monkeypatch):
+    # With one slot the second send waits on the semaphore, binding it to the loop
+    monkeypatch.setattr(telegram_adapter, "MAX_CONCURRENT_SENDS", 1)
+    payloads = [{"chat_id": 1, "text": "a"}, {"chat_id": 2, "text": "b"}]
+
+    first = asyncio.run(adapter.send_message_many(payloads))
+    second = asyncio.run(adapter.send_message_many(payloads))
+
+    assert all(result["ok"] for result in first + second)
+    assert len(fake_client.requests) == 4
+
+
+def rate_limited_then_ok(limited_times, body=None, headers=None):
+    calls = {"count": 0}
+
+    def handler(method, request_body):
+        calls["count"] += 1
+        if calls["count"] <= limited_times:
+            return 429, body or {"ok": False, "error_code": 429}, headers
+        return 200, {"ok": True, "result": True}
+
+    return handler
+
+
+@pytest.mark.unit
+async def test_call_retries_429_after_body_retry_after(adapter, fake_client, recorded_sleeps):
+    fake_client.handler = rate_limited_then_ok(1, body={"ok": False, "parameters": {"retry_after": 3}})
+
+    result = await adapter.send_message(chat_id=1, text="Oi")
+
+    assert result == {"ok": True, "result": True}
+    assert len(fake_client.requests) == 2
+    assert recorded_sleeps == [pytest.approx(3.05)]
+
+
+@pytest.mark.unit
+async def test_call_falls_back_to_retry_after_header(adapter, fake_client, recorded_sleeps):
+    fake_client.handler = rate_limited_then_ok(1, headers={"Retry-After": "2"})
+
+    await adapter.get_me()
+
+    assert recorded_sleeps == [pytest.approx(2.05)]
+
+
+@pytest.mark.unit
+async def test_call_raises_once_429_retries_are_exhausted(adapter, fake_client, recorded_sleeps):
+    fake_client.handler = rate_limited_then_ok(100, body={"ok": False, "parameters": {"retry_after": 1}})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await adapter.send_message(chat_id=1, text="Oi")
+
+    assert exc_info.value.response.status_code == 429
+    assert len(fake_client.requests) == telegram_adapter.MAX_RATE_LIMIT_RETRIES + 1
+    assert len(recorded_sleeps) == telegram_adapter.MAX_RATE_LIMIT_RETRIES
+
+
+@pytest.mark.unit
+async def test_call_raises_on_error_status_without_retrying(adapter, fake_client, recorded_sleeps):
+    fake_client.handler = lambda method, body: (403, {"ok": False, "description": "Forbidden"})
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await adapter.send_message(chat_id=1, text="Oi")
+
+    assert exc_info.value.response.status_code == 403
+    assert len(fake_client.requests) == 1
+    assert recorded_sleeps == []
+
+
+@pytest.mark.unit
+async def test_throttled_send_releases_slot_while_waiting_out_429(adapter, fake_client, monkeypatch):
+    monkeypatch.setattr(telegram_adapter, "MAX_CONCURRENT_SENDS", 1)
+    limited = {"done": False}
+
+    def handler(method, body):
+        if body["chat_id"] == 1 and not limited["done"]:
+            limited["done"] = True
+            return 429, {"ok": False, "parameters": {"retry_after": 0}}
+        return 200, {"ok": True, "result": body["chat_id"]}
+
+    fake_client.handler = handler
+
+    results = await adapter.send_message_many([{"chat_id": 1, "text": "a"}, {"chat_id": 2, "text": "b"}])
+
+    assert [result["result"] for result in results] == [1, 2]
+    # Chat 2 went out while chat 1 was waiting to retry
+    assert [body["chat_id"] for _, body in fake_client.requests] == [1, 2, 1]
+
+
+@pytest.mark.unit
+async def test_overlapping_broadcasts_keep_per_chat_order(adapter, fake_client):
+    delivered = []
+
+    async def handler(method, body):
+        # The first broadcast is slow, so without per-chat ordering the
+        # second one would reach chat 1 first
+        if body["text"] == "first":
+            await asyncio.sleep(0.02)
+        delivered.append((body["chat_id"], body["text"]))
+        return 200, {"ok": True, "result": body["chat_id"]}
+
+    fake_client.handler = handler
+
+    first, second = await asyncio.gather(
+        adapter.broadcast([1, 2], "first"),
+        adapter.broadcast([1], "second"),
+    )
+
+    assert [result["result"] for result in first] == [1, 2]
+    assert [result["result"] for result in second] == [1]
+    assert [text for chat_id, text in delivered if chat_id == 1] == ["first", "second"]
+
+
+@pytest.mark.unit
+async def test_chat_locks_are_dropped_after_broadcast(adapter, fake_client):
+    await adapter.broadcast([1, 2, 3], "Oi")
+    gc.collect()
+
+    assert len(telegram_adapter._get_send_limits().chat_locks) == 0
+
+
+@pytest.mark.unit
+async def test_set_my_commands_posts_command_list(adapter, fake_client):
+    commands = [{"command": "start", "description": "Iniciar"}]
+
+    await adapter.set_my_commands(commands)
+
+    assert fake_client.requests == [("setMyCommands", {"commands": commands})]
+
+
+def callback_update(data="menu:1"):
+    return {
+        "update_id": 2,
+        "callback_query": {
+            "id": "cb-1",
+            "data": data,
+            "message": {
+                "message_id": 11,
+                "from": {"id": 99, "username": "bot", "first_name": "Bot"},
+                "chat": {"id": 42, "type": "private"},
+            },
+        },
+    }
+
+
+@pytest.mark.unit
+def test_parse_text_message(adapter):
+    event = adapter.parse_webhook_update(text_update(update_id=1, text="Preciso de ajuda"))
+
+    assert isinstance(event, WebhookEvent)
+    assert event.external_user_id == "telegram:42"
+    assert event.text == "Preciso de ajuda"
+    assert event.metadata == {
+        "update_id": 1,
+        "message_id": 10,
+        "chat_id": 42,
+        "chat_type": "private",
+        "username": "ana",
+        "first_name": "Ana",
+        "last_name": None,
+        "language_code": "pt-br",
+    }
+
+
+@pytest.mark.unit
+def test_parse_caption_as_text(adapter):
+    update = text_update()
+    del update["message"]["text"]
+    update["message"]["caption"] = "Foto do erro"
+
+    assert adapter.parse_webhook_update(update).text == "Foto do erro"
+
+
+@pytest.mark.unit
+def test_parse_callback_query(adapter):
+    event = adapter.parse_webhook_update(callback_update(data="menu:1"))
+
+    # The user id comes from the callback's message, as before the rewrite
+    assert event.external_user_id == "telegram:99"
+    assert event.text == "menu:1"
+    assert event.metadata["callback_query_id"] == "cb-1"
+    assert event.metadata["chat_id"] == 42
+    assert "language_code" not in event.metadata
+
+
+@pytest.mark.unit
+def test_parse_callback_query_with_empty_data_returns_none(adapter):
+    assert adapter.parse_webhook_update(callback_update(data="")) is None
+    assert adapter.parse_webhook_update(callback_update(data=None)) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("update", [
+    {"update_id": 3},
+    {"update_id": 3, "edited_message": {"text": "editado"}},
+    {"update_id": 3, "message": {"message_id": 1, "chat": {"id": 42}}},
+])
+def test_parse_update_without_message_text_returns_none(adapter, update):
+    assert adapter.parse_webhook_update(update) is None
+
+
+@pytest.mark.unit
+def test_parse_message_without_from_or_chat(adapter):
+    event = adapter.parse_webhook_update({"update_id": 4, "message": {"text": "Oi"}})
+
+    assert event.external_user_id == "telegram:None"
+    assert event.metadata["chat_id"] is None
+
+
+@pytest.mark.unit
+def test_webhook_event_to_dict_matches_previous_shape(adapter):
+    event = adapter.parse_webhook_update(text_update())
+
+    assert event.to_dict() == {
+        "external_user_id": event.external_user_id,
+        "text": event.text,
+        "metadata": event.metadata,
+    }
+
+
+@pytest.mark.unit
+def test_parse_webhook_update_bytes(adapter):
+    raw = orjson.dumps(text_update(text="Oi"))
+
+    assert adapter.parse_webhook_update_bytes(raw) == adapter.parse_webhook_update(text_update(text="Oi"))
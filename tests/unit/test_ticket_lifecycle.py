@@ -0,0 +1,61 @@
+import pytest
+
+from src.config import settings
+from src.database import (
+    COLLECTION_TICKETS,
+    COLLECTION_TICKET_LIFECYCLE_EVENTS,
+    COLLECTION_COMPANY_CONFIGS,
+)
+from src.models import TicketStatus
+from src.utils.ticket_lifecycle import EVENT_AUTO_CLOSE, process_due_lifecycle_events
+
+
+class FakeLifecycleEvents:
+    def __init__(self, events):
+        self.events = list(events)
+
+    async def find_one_and_update(self, *args, **kwargs):
+        return self.events.pop(0) if self.events else None
+
+
+class FakeTickets:
+    def __init__(self, ticket):
+        self.ticket = ticket
+        self.updates = []
+
+    async def find_one(self, *args, **kwargs):
+        return self.ticket
+
+    async def update_one(self, filter_dict, update_dict, *args, **kwargs):
+        self.updates.append(update_dict)
+
+
+class FakeCompanies:
+    async def find_one(self, *args, **kwargs):
+        return None
+
+
+@pytest.mark.unit
+async def test_auto_close_runs_without_telegram_token(monkeypatch):
+    tickets = FakeTickets({
+        "ticket_id": "T-1",
+        "company_id": "comp_001",
+        "channel": "telegram",
+        "external_user_id": "telegram:42",
+        "status": TicketStatus.ESCALATED,
+    })
+    collections = {
+        COLLECTION_TICKET_LIFECYCLE_EVENTS: FakeLifecycleEvents([
+            {"ticket_id": "T-1", "event_type": EVENT_AUTO_CLOSE},
+        ]),
+        COLLECTION_TICKETS: tickets,
+        COLLECTION_COMPANY_CONFIGS: FakeCompanies(),
+    }
+    monkeypatch.setattr("src.utils.ticket_lifecycle.get_collection", lambda name: collections[name])
+    monkeypatch.setattr(settings, "telegram_bot_token", None)
+
+    await process_due_lifecycle_events()
+
+    # The ticket is still closed; only the Telegram notification is skipped
+    assert tickets.updates[0]["$set"]["status"] == TicketStatus.AUTO_RESOLVED
+    assert tickets.updates[1]["$set"]["lifecycle_stage"] == "auto_closed"